@@ -0,0 +1,269 @@
+"""Benchmark the install pipeline against a local mock release server.
+
+    python benchmark.py --sizes 1M,16M,128M --latency 0.05 --output after.json --baseline before.json
+
+Run once with --no-verify and pass that as --baseline to see what download
+verification costs. --startup also times the wizard from process start to
+its first window (needs a display) and fails the run if that is over budget.
+
+Every install runs in its own child process so peak RSS and bytes written
+belong to that install alone. Each size is installed cold (empty download
+cache) and then warm (same cache, reinstall of the same version).
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def parse_size(text):
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+    text = text.strip().upper()
+    if text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def peak_rss():
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().peak_wset
+
+
+def bytes_written():
+    try:
+        with open("/proc/self/io", "r") as f:
+            for line in f:
+                if line.startswith("wchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().io_counters().write_bytes
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# =========================================================
+# CHILD: ONE INSTALL
+# =========================================================
+
+def run_child(args):
+    import installer
+    from installer import Installer, InstallObserver, InstallPaths
+
+    installer.CHUNK_SIZE = args.chunk_size
+    installer.RETRY_BACKOFF = 0.05
+    installer.VERIFY_DOWNLOADS = not args.no_verify
+
+    class ErrorCatcher(InstallObserver):
+        def __init__(self):
+            self.error = None
+
+        def on_failed(self, error):
+            self.error = error
+
+    paths = InstallPaths.under(args.root)
+    for year, release in (("2023", "R24.2"), ("2024", "R24.3"), ("2025", "R25.0")):
+        os.makedirs(os.path.join(paths.roaming_appdata, "Autodesk", f"AutoCAD {year}",
+                                 release, "enu", "Support"), exist_ok=True)
+
+    timer = ErrorCatcher()
+    engine = Installer(paths=paths, releases_url=args.url + "/releases", cuix_url=args.url + "/cuix",
+                       data_dir=args.data_dir, workers=args.workers, downloads_url=args.url + "/releases")
+    engine.subscribe(timer)
+
+    written_before = bytes_written()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(sys.stderr):
+        ok = engine.run()
+    finished = time.perf_counter()
+
+    # the installer times its own phases; see InstallMetrics
+    phases = {}
+    for record in engine.metrics.summary()["phases"]:
+        phases[record["phase"]] = phases.get(record["phase"], 0.0) + record["seconds"]
+
+    written_after = bytes_written()
+    json.dump({
+        "ok": ok,
+        "error": str(timer.error) if timer.error else None,
+        "seconds": finished - started,
+        "phases": phases,
+        "peak_rss": peak_rss(),
+        "bytes_written": written_after - written_before if written_before is not None else None,
+    }, sys.stdout)
+    return 0 if ok else 1
+
+
+# =========================================================
+# PARENT: SCENARIOS
+# =========================================================
+
+def run_scenario(args, size, work):
+    from mock_release_server import MockReleaseServer, build_release
+
+    release_dir = os.path.join(work, "release")
+    assets = build_release(release_dir, "0.0.1", size)
+    server = MockReleaseServer("0.0.1", assets, cuix=os.urandom(1024 * 1024),
+                               bandwidth=args.bandwidth, latency=args.latency,
+                               error_rate=args.error_rate, seed=args.seed).start()
+    data_dir = os.path.join(work, "data")
+    results = []
+    try:
+        for run in ("cold", "warm"):
+            root = os.path.join(work, "root-" + run)
+            before = (server.requests, server.bytes_sent, server.errors_injected)
+            child = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), "--child",
+                 "--url", server.url, "--root", root, "--data-dir", data_dir,
+                 "--chunk-size", str(args.chunk_size), "--workers", str(args.workers)]
+                + (["--no-verify"] if args.no_verify else []),
+                cwd=HERE, capture_output=True, text=True)
+            try:
+                result = json.loads(child.stdout)
+            except ValueError:
+                result = {"ok": False, "error": child.stderr.strip()[-500:]}
+            result.update(size=size, run=run,
+                          requests=server.requests - before[0],
+                          bytes_served=server.bytes_sent - before[1],
+                          errors_injected=server.errors_injected - before[2])
+            if result.get("seconds"):
+                result["throughput_mb_s"] = size / result["seconds"] / 1024 ** 2
+            results.append(result)
+    finally:
+        server.stop()
+    return results
+
+
+def measure_startup(runs=5):
+    """Time from process start to the wizard's first painted window, in fresh processes."""
+    times = []
+    for _ in range(runs):
+        child = subprocess.run([sys.executable, os.path.join(HERE, "setup.py"), "--startup-probe"],
+                               cwd=HERE, capture_output=True, text=True)
+        try:
+            probe = json.loads(child.stdout.strip().splitlines()[-1])
+        except (ValueError, IndexError):
+            # typically no display to open a window on
+            lines = child.stderr.strip().splitlines()
+            return {"error": lines[-1] if lines else f"exit code {child.returncode}"}
+        times.append(probe["startup_seconds"])
+    times.sort()
+    return {"seconds": times[0], "median": times[len(times) // 2], "budget": probe["budget"],
+            "over_budget": times[len(times) // 2] > probe["budget"]}
+
+
+def print_table(results, baseline=None):
+    previous = {(r["size"], r["run"]): r for r in (baseline or {}).get("results", [])}
+    print(f"{'size':>10} {'run':>5} {'seconds':>9} {'MB/s':>8} {'peak RSS MB':>12} "
+          f"{'written MB':>11} {'served MB':>10} {'errors':>6}  change")
+    for r in results:
+        if not r.get("ok"):
+            print(f"{r['size']:>10} {r['run']:>5}  FAILED: {r.get('error')}")
+            continue
+        change = ""
+        old = previous.get((r["size"], r["run"]))
+        if old and old.get("seconds"):
+            change = f"{(r['seconds'] / old['seconds'] - 1) * 100:+.1f}%"
+        mb = 1024 ** 2
+        print(f"{r['size']:>10} {r['run']:>5} {r['seconds']:>9.3f} {r.get('throughput_mb_s', 0):>8.1f} "
+              f"{(r['peak_rss'] or 0) / mb:>12.1f} {(r['bytes_written'] or 0) / mb:>11.1f} "
+              f"{r['bytes_served'] / mb:>10.1f} {r['errors_injected']:>6}  {change}")
+        print("            " + "  ".join(f"{k}={v:.3f}s" for k, v in r["phases"].items()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1M,16M,128M",
+                        help="comma separated release sizes, e.g. 1M,64M,1G")
+    parser.add_argument("--bandwidth", type=parse_size, default=0,
+                        help="per-connection bandwidth in bytes/s, 0 for unlimited (e.g. 10M)")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="fraction of asset responses cut off mid-transfer")
+    parser.add_argument("--seed", type=int, default=0, help="seed for error injection")
+    parser.add_argument("--chunk-size", type=parse_size, default=8192)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--no-verify", action="store_true",
+                        help="skip SHA-256 verification of downloads, to measure what it costs")
+    parser.add_argument("--startup", action="store_true",
+                        help="also time the wizard's first window against its budget")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON from an earlier run to compare against")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    parser.add_argument("--root", help=argparse.SUPPRESS)
+    parser.add_argument("--data-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        return run_child(args)
+
+    results = []
+    for size in [parse_size(s) for s in args.sizes.split(",") if s]:
+        work = tempfile.mkdtemp(prefix="svl-bench-")
+        try:
+            results.extend(run_scenario(args, size, work))
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {k: v for k, v in vars(args).items()
+                   if k in ("bandwidth", "latency", "error_rate", "seed", "chunk_size", "workers",
+                             "no_verify")},
+        "results": results,
+    }
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    if results:
+        print_table(results, baseline)
+
+    ok = all(r.get("ok") for r in results)
+    if args.startup:
+        report["startup"] = startup = measure_startup()
+        if "error" in startup:
+            print(f"first window: skipped ({startup['error']})")
+        else:
+            print(f"first window: {startup['median']:.3f}s median, {startup['seconds']:.3f}s best "
+                  f"(budget {startup['budget']}s{', OVER BUDGET' if startup['over_budget'] else ''})")
+            ok = ok and not startup["over_budget"]
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
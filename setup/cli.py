@@ -0,0 +1,143 @@
+import argparse
+import contextlib
+import json
+import sys
+import threading
+
+import requests
+
+from installer import (Installer, InstallObserver, InstallCancelled, RateMeter,
+                       DOWNLOAD_WORKERS, MIRROR, SETUP_DATA_DIR, TAG_PREFIX)
+
+POLL_SECONDS = 0.2
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_EULA_NOT_ACCEPTED = 3
+EXIT_CANCELLED = 4
+EXIT_NETWORK = 5
+
+
+class JsonReporter(InstallObserver):
+    """Writes one JSON object per line so deployment tooling can follow the install."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.lock = threading.Lock()
+        self.last_percent = None
+        self.error = None
+        self.meter = RateMeter()
+
+    def emit(self, event, **fields):
+        with self.lock:
+            self.stream.write(json.dumps(dict(event=event, **fields)) + "\n")
+            self.stream.flush()
+
+    def on_status(self, text):
+        self.emit("status", message=text)
+
+    def on_failed(self, error):
+        self.error = error
+
+    def on_progress(self, value):
+        percent = int(value)
+        if percent != self.last_percent:
+            self.last_percent = percent
+            self.emit("progress", percent=percent)
+
+    def poll(self, installer):
+        # sampled on a timer, so the output rate does not depend on the chunk size
+        percent, done, total = installer.snapshot()
+        if not total:
+            return
+        rate = self.meter.update(done)
+        if int(percent) != self.last_percent:
+            self.last_percent = int(percent)
+            eta = self.meter.eta(total - done)
+            self.emit("progress", percent=int(percent), bytes=done, total=total,
+                      mb_per_s=round(rate / 1024 ** 2, 2),
+                      eta_s=round(eta, 1) if eta is not None else None)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="setup",
+        description="Install StreetViewLocate without the setup wizard.")
+    parser.add_argument("--silent", action="store_true", required=True,
+                        help="run without any window")
+    parser.add_argument("--accept-eula", action="store_true",
+                        help="accept the end user license agreement")
+    parser.add_argument("--target-version",
+                        help="install this release instead of the latest, e.g. 1.2")
+    parser.add_argument("--cache-dir", default=SETUP_DATA_DIR,
+                        help="folder for partial downloads and the download cache")
+    parser.add_argument("--concurrency", type=int, default=DOWNLOAD_WORKERS,
+                        help="number of parallel downloads")
+    parser.add_argument("--mirror", default=MIRROR,
+                        help="office mirror to try before GitHub: an http(s) URL or a shared folder")
+    parser.add_argument("--force", action="store_true",
+                        help="reinstall even if this version is already installed")
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    return args
+
+
+def run(args, reporter):
+    if not args.accept_eula:
+        reporter.emit("result", status="eula-not-accepted", exit_code=EXIT_EULA_NOT_ACCEPTED)
+        return EXIT_EULA_NOT_ACCEPTED
+
+    installer = Installer(args.target_version or "",
+                          tag=TAG_PREFIX + args.target_version if args.target_version else None,
+                          data_dir=args.cache_dir,
+                          workers=args.concurrency,
+                          mirror=args.mirror)
+    installer.subscribe(reporter)
+    outcome = {}
+
+    def work():
+        try:
+            installer.resolve_version()
+            if not args.force and installer.is_already_installed():
+                outcome["status"] = "up-to-date"
+                return
+        except Exception as e:
+            outcome["error"] = e
+            return
+        if installer.run():
+            outcome["status"] = "installed"
+        else:
+            outcome["error"] = reporter.error
+
+    thread = threading.Thread(target=work, daemon=True)
+    thread.start()
+    try:
+        while thread.is_alive():
+            thread.join(POLL_SECONDS)
+            reporter.poll(installer)
+    except KeyboardInterrupt:
+        installer.cancel()
+        thread.join()
+
+    error = outcome.get("error")
+    if error is None:
+        reporter.emit("result", status=outcome["status"], version=installer.version, exit_code=EXIT_OK)
+        return EXIT_OK
+    if isinstance(error, InstallCancelled):
+        code, status = EXIT_CANCELLED, "cancelled"
+    elif isinstance(error, requests.RequestException):
+        code, status = EXIT_NETWORK, "network-error"
+    else:
+        code, status = EXIT_FAILED, "failed"
+    reporter.emit("result", status=status, error=str(error), exit_code=code)
+    return code
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    reporter = JsonReporter(sys.stdout)
+    # keep stdout machine-readable; stray diagnostics go to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        return run(args, reporter)
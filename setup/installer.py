@@ -0,0 +1,1921 @@
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+import zipfile
+import zlib
+import struct
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import json
+import hashlib
+import io
+import contextlib
+import platform
+import uuid
+import pathlib
+import urllib.parse
+import urllib.request
+import email.utils
+import xml.etree.ElementTree as ET
+
+GITHUB_RELEASES = "https://api.github.com/repos/BHUTUU/streetViewLocate/releases"
+GITHUB_DOWNLOADS = "https://github.com/BHUTUU/streetViewLocate/releases"
+TAG_PREFIX = "StreetViewLocate_V"
+APP_NAME = "StreetViewLocate"
+DOWNLOAD_WORKERS = 4
+DOWNLOAD_SEGMENTS = 4
+SEGMENT_THRESHOLD = 32 * 1024 * 1024
+CHUNK_SIZE = 8192
+MAX_RETRIES = 5
+RETRY_BACKOFF = 1.0
+SETUP_DATA_DIR = os.path.join(os.environ.get("LOCALAPPDATA", tempfile.gettempdir()), APP_NAME + "Setup")
+CACHE_DIR = os.path.join(SETUP_DATA_DIR, "cache")
+CACHE_LIMIT = 512 * 1024 * 1024
+VERIFY_DOWNLOADS = True
+CUIX_URL = "https://raw.githubusercontent.com/BHUTUU/streetViewLocate/main/setup/bhutuu.cuix"
+MANIFEST_ASSET = "StreetViewLocate_manifest.json"
+INDEX_ASSET = "StreetViewLocate_index.json"
+RESOURCE_DIR = "StreetViewBySumanKumarBHUTUU"
+CONFIG_FILE = "streetViewLocate_configuration.json"
+METRICS_LOG_LIMIT = 1024 * 1024
+MIRROR = os.environ.get("STREETVIEWLOCATE_MIRROR")
+MIRROR_INDEX = "release.json"
+CUIX_NAME = "bhutuu.cuix"
+LISP_BEGIN = ";; >>> StreetViewLocate (written by setup; changes inside this block are overwritten)"
+LISP_END = ";; <<< StreetViewLocate"
+
+
+class InstallCancelled(Exception):
+    pass
+
+
+class IncompleteDownload(Exception):
+    pass
+
+
+class RangeNotSupported(Exception):
+    pass
+
+
+class DeltaUnavailable(Exception):
+    pass
+
+
+class IntegrityError(Exception):
+    pass
+
+
+class FileRangeReader(io.RawIOBase):
+    """The requested byte range of an open file, as the raw body of a response."""
+
+    def __init__(self, f, length):
+        self.f = f
+        self.left = length
+        self.position = 0
+        self.decode_content = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.f.read(min(len(buffer), self.left))
+        buffer[:len(data)] = data
+        self.left -= len(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def close(self):
+        self.f.close()
+        super().close()
+
+
+class LocalFileAdapter(BaseAdapter):
+    """Serves file:// URLs, including UNC shares, with Range support.
+
+    Mounted on every session so a shared-folder mirror goes through the same
+    download, resume and delta code as an HTTP one.
+    """
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.raw = io.BytesIO(b"")
+
+        parsed = urllib.parse.urlparse(request.url)
+        path = urllib.request.url2pathname(
+            ("//" + parsed.netloc if parsed.netloc else "") + urllib.parse.unquote(parsed.path))
+        try:
+            f = open(path, "rb")
+        except OSError:
+            response.status_code, response.reason = 404, "Not Found"
+            return response
+        stat = os.fstat(f.fileno())
+        start, end = 0, stat.st_size
+
+        match = re.match(r"bytes=(\d+)-(\d*)$", request.headers.get("Range", ""))
+        if match:
+            start = int(match.group(1))
+            end = min(int(match.group(2)) + 1, stat.st_size) if match.group(2) else stat.st_size
+            if start >= stat.st_size:
+                f.close()
+                response.status_code, response.reason = 416, "Range Not Satisfiable"
+                response.headers["Content-Range"] = f"bytes */{stat.st_size}"
+                return response
+            response.status_code, response.reason = 206, "Partial Content"
+            response.headers["Content-Range"] = f"bytes {start}-{end - 1}/{stat.st_size}"
+        else:
+            response.status_code, response.reason = 200, "OK"
+
+        f.seek(start)
+        response.raw = FileRangeReader(f, end - start)
+        response.headers["Content-Length"] = str(end - start)
+        response.headers["Accept-Ranges"] = "bytes"
+        response.headers["Last-Modified"] = email.utils.formatdate(stat.st_mtime, usegmt=True)
+        return response
+
+    def close(self):
+        pass
+
+
+def create_session(pool_size=DOWNLOAD_WORKERS * DOWNLOAD_SEGMENTS):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.mount("file://", LocalFileAdapter())
+    return session
+
+
+def is_transient(error):
+    """Whether a failed download is worth retrying: a dropped connection or a server error, not a 4xx."""
+    if isinstance(error, requests.HTTPError):
+        return error.response is None or error.response.status_code >= 500
+    return isinstance(error, (requests.ConnectionError, requests.Timeout,
+                              requests.exceptions.ChunkedEncodingError, IncompleteDownload))
+
+
+def mirror_url(location):
+    """Base URL of a mirror given as an http(s) URL or a local/UNC folder."""
+    if re.match(r"^[a-z][a-z0-9+.-]*://", location, re.IGNORECASE):
+        return location.rstrip("/")
+    return pathlib.Path(os.path.abspath(location)).as_uri()
+
+
+def mirror_folder(base_url):
+    """The folder behind a file:// mirror URL, None for HTTP mirrors."""
+    parsed = urllib.parse.urlparse(base_url or "")
+    if parsed.scheme != "file":
+        return None
+    return urllib.request.url2pathname(
+        ("//" + parsed.netloc if parsed.netloc else "") + urllib.parse.unquote(parsed.path))
+
+
+def publish_release(folder, data, files):
+    """Copy release files into a mirror folder and list them in its index.
+
+    files maps asset names (and CUIX_NAME) to local copies. Each file is
+    written under a temporary name and renamed, and the index is replaced
+    after the files, so seats reading the folder never see an entry for a
+    half-written or outdated file.
+    """
+    os.makedirs(folder, exist_ok=True)
+    index_path = os.path.join(folder, MIRROR_INDEX)
+
+    def write_index(index):
+        tmp_path = f"{index_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, index_path)
+
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        index = {}
+    if index.get("tag_name") != data.get("tag_name"):
+        # asset names repeat across releases: drop the old entries before any file is replaced
+        index = {"tag_name": data.get("tag_name"), "assets": []}
+        write_index(index)
+
+    published = {asset["name"]: asset for asset in index.get("assets", [])}
+    for asset in data["assets"]:
+        path = files.get(asset["name"])
+        if path is None:
+            continue
+        entry = {k: v for k, v in asset.items() if k not in ("browser_download_url", "github_url")}
+        target = os.path.join(folder, asset["name"])
+        if published.get(asset["name"]) == entry and os.path.isfile(target):
+            continue
+        tmp_path = f"{target}.{uuid.uuid4().hex}.tmp"
+        shutil.copyfile(path, tmp_path)
+        os.replace(tmp_path, target)
+        published[asset["name"]] = entry
+
+    if CUIX_NAME in files:
+        tmp_path = os.path.join(folder, f"{CUIX_NAME}.{uuid.uuid4().hex}.tmp")
+        shutil.copyfile(files[CUIX_NAME], tmp_path)
+        os.replace(tmp_path, os.path.join(folder, CUIX_NAME))
+        index["cuix"] = CUIX_NAME
+
+    index.update(assets=list(published.values()), published=time.time())
+    write_index(index)
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def crc32_file(path):
+    crc = 0
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            crc = zlib.crc32(block, crc)
+    return crc
+
+
+def asset_cache_key(asset):
+    return f"{asset.get('id', 0)}-{asset['name']}-{asset.get('size', 0)}"
+
+
+def asset_sha256(asset, manifest=None):
+    """Published SHA-256 of a release asset: GitHub's "sha256:..." digest, else the manifest's."""
+    digest = asset.get("digest") or ""
+    if digest.startswith("sha256:"):
+        return digest[len("sha256:"):].lower()
+    entry = (manifest or {}).get("assets", {}).get(asset["name"])
+    return entry["sha256"].lower() if entry else None
+
+
+class StreamDigest:
+    """SHA-256 fed with the download chunks as they arrive, like StreamingZipExtractor."""
+
+    def __init__(self):
+        self.hash = hashlib.sha256()
+        self.fed = 0
+
+    def feed(self, data):
+        self.fed += len(data)
+        self.hash.update(data)
+
+    def hexdigest(self):
+        return self.hash.hexdigest()
+
+
+def member_path(dest, name):
+    # same sanitising as ZipFile.extract: no drive, no "..", no absolute paths
+    arcname = name.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid = ("", os.path.curdir, os.path.pardir)
+    arcname = os.path.sep.join(x for x in arcname.split(os.path.sep) if x not in invalid)
+    if os.path.sep == "\\":
+        arcname = zipfile.ZipFile._sanitize_windows_name(arcname, os.path.sep)
+    return os.path.join(dest, arcname)
+
+
+class StreamingUnsupported(Exception):
+    pass
+
+
+class StreamingZipExtractor:
+    """Extracts zip members from the local file headers while the archive streams in.
+
+    Bytes are pushed with feed(). Anything that needs the central directory
+    (encryption, zip64, stored members with a data descriptor, unknown
+    compression) marks the extractor as failed; the caller then extracts the
+    finished file with zipfile instead.
+    """
+
+    LOCAL_HEADER = 0x04034B50
+    CENTRAL_HEADER = 0x02014B50
+    END_RECORD = 0x06054B50
+    DESCRIPTOR = 0x08074B50
+
+    def __init__(self, dest):
+        self.dest = dest
+        self.buffer = bytearray()
+        self.member = None
+        self.fed = 0
+        self.complete = False
+        self.failed = False
+
+    def feed(self, data):
+        self.fed += len(data)
+        if self.complete or self.failed:
+            return
+        self.buffer += data
+        try:
+            while not self.complete and self.step():
+                pass
+        except (StreamingUnsupported, zipfile.BadZipFile, zlib.error):
+            self.abort()
+
+    def abort(self):
+        self.failed = True
+        self.buffer = bytearray()
+        if self.member and self.member["file"]:
+            self.member["file"].close()
+        self.member = None
+
+    def step(self):
+        if self.member is None:
+            return self.read_header()
+        if self.member["phase"] == "data":
+            return self.read_data()
+        return self.read_descriptor()
+
+    def read_header(self):
+        if len(self.buffer) < 4:
+            return False
+        signature = struct.unpack_from("<I", self.buffer)[0]
+        if signature in (self.CENTRAL_HEADER, self.END_RECORD):
+            self.complete = True
+            self.buffer = bytearray()
+            return False
+        if signature != self.LOCAL_HEADER:
+            raise StreamingUnsupported("Unexpected zip record.")
+        if len(self.buffer) < 30:
+            return False
+
+        (_, _, flag, method, _, _, crc, csize, usize,
+         name_len, extra_len) = struct.unpack_from("<IHHHHHIIIHH", self.buffer)
+        header_len = 30 + name_len + extra_len
+        if len(self.buffer) < header_len:
+            return False
+        raw_name = bytes(self.buffer[30:30 + name_len])
+        del self.buffer[:header_len]
+
+        descriptor = bool(flag & 0x08)
+        if flag & 0x01 or method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise StreamingUnsupported("Encrypted or unsupported member.")
+        if 0xFFFFFFFF in (csize, usize) or (descriptor and method == zipfile.ZIP_STORED):
+            raise StreamingUnsupported("Member needs the central directory.")
+
+        name = raw_name.decode("utf-8" if flag & 0x800 else "cp437")
+        path = member_path(self.dest, name)
+        if name.endswith("/"):
+            os.makedirs(path, exist_ok=True)
+            out = None
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            out = open(path, "wb")
+
+        self.member = {
+            "name": name,
+            "file": out,
+            "phase": "data",
+            "descriptor": descriptor,
+            "crc": crc,
+            "csize": csize,
+            "usize": usize,
+            "remaining": csize,
+            "consumed": 0,
+            "written": 0,
+            "running_crc": 0,
+            "inflater": zlib.decompressobj(-15) if method == zipfile.ZIP_DEFLATED else None,
+        }
+        return True
+
+    def write(self, data):
+        member = self.member
+        if data:
+            member["running_crc"] = zlib.crc32(data, member["running_crc"])
+            member["written"] += len(data)
+            if member["file"]:
+                member["file"].write(data)
+
+    def read_data(self):
+        member = self.member
+        if member["descriptor"]:
+            if not self.buffer:
+                return False
+            inflater = member["inflater"]
+            data = bytes(self.buffer)
+            self.write(inflater.decompress(data))
+            member["consumed"] += len(data) - len(inflater.unused_data)
+            self.buffer = bytearray(inflater.unused_data)
+            if not inflater.eof:
+                return False
+            member["phase"] = "descriptor"
+            return True
+
+        if member["remaining"] and not self.buffer:
+            return False
+        take = min(member["remaining"], len(self.buffer))
+        data = bytes(self.buffer[:take])
+        del self.buffer[:take]
+        member["remaining"] -= take
+        if member["inflater"]:
+            data = member["inflater"].decompress(data)
+            if not member["remaining"]:
+                data += member["inflater"].flush()
+        self.write(data)
+        if member["remaining"]:
+            return False
+        self.finish_member()
+        return True
+
+    def read_descriptor(self):
+        if len(self.buffer) < 4:
+            return False
+        has_signature = struct.unpack_from("<I", self.buffer)[0] == self.DESCRIPTOR
+        length = 16 if has_signature else 12
+        if len(self.buffer) < length:
+            return False
+        crc, csize, usize = struct.unpack_from("<III", self.buffer, length - 12)
+        if csize != self.member["consumed"]:
+            raise StreamingUnsupported("Zip64 data descriptor.")
+        del self.buffer[:length]
+        self.member.update(crc=crc, csize=csize, usize=usize)
+        self.finish_member()
+        return True
+
+    def finish_member(self):
+        member = self.member
+        if member["file"]:
+            member["file"].close()
+        self.member = None
+        if member["running_crc"] != member["crc"] or member["written"] != member["usize"]:
+            raise zipfile.BadZipFile(f"Bad CRC or size for {member['name']}.")
+
+
+class HttpRangeFile(io.RawIOBase):
+    """Read-only, seekable view of a remote file backed by HTTP Range requests.
+
+    Wrapped in io.BufferedReader it lets zipfile read the central directory
+    and single members of a release zip without downloading the rest. Each
+    range request goes through retry(func, *args) when one is given.
+    """
+
+    def __init__(self, session, url, size, cancel_event=None, retry=None):
+        self.session = session
+        self.url = url
+        self.size = size
+        self.cancel_event = cancel_event
+        self.retry = retry
+        self.position = 0
+        self.transferred = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self.position = offset
+        elif whence == io.SEEK_CUR:
+            self.position += offset
+        else:
+            self.position = self.size + offset
+        return self.position
+
+    def readinto(self, buffer):
+        if self.position >= self.size or not len(buffer):
+            return 0
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise InstallCancelled("Installation cancelled.")
+        end = min(self.position + len(buffer), self.size) - 1
+        if self.retry:
+            data = self.retry(self.read_range, self.position, end)
+        else:
+            data = self.read_range(self.position, end)
+        buffer[:len(data)] = data
+        self.position += len(data)
+        self.transferred += len(data)
+        return len(data)
+
+    def read_range(self, start, end):
+        r = self.session.get(self.url, timeout=30, headers={"Range": f"bytes={start}-{end}"})
+        r.raise_for_status()
+        if r.status_code != 206:
+            raise RangeNotSupported(self.url)
+        data = r.content
+        if len(data) != end + 1 - start:
+            raise IncompleteDownload(f"{self.url}: expected {end + 1 - start} bytes, got {len(data)}.")
+        return data
+
+
+def file_matches(path, entry):
+    return (os.path.isfile(path)
+            and os.path.getsize(path) == entry["size"]
+            and sha256_file(path) == entry["sha256"])
+
+
+class LocalFileIndex:
+    """Finds installed files by size and SHA-256 so unchanged content can be reused."""
+
+    def __init__(self, roots):
+        self.by_size = {}
+        self.hashes = {}
+        for root in roots:
+            for folder, _, files in os.walk(root):
+                for name in files:
+                    path = os.path.join(folder, name)
+                    self.by_size.setdefault(os.path.getsize(path), []).append(path)
+
+    def find(self, entry):
+        for path in self.by_size.get(entry["size"], []):
+            if path not in self.hashes:
+                self.hashes[path] = sha256_file(path)
+            if self.hashes[path] == entry["sha256"]:
+                return path
+        return None
+
+
+class DownloadCache:
+    """Content-addressed store of downloaded files with LRU eviction.
+
+    Blobs are saved under their SHA-256 and looked up through index.json,
+    which maps an asset key (id, name, size) to the blob's hash and last use.
+    """
+
+    def __init__(self, root, limit):
+        self.root = root
+        self.limit = limit
+        self.lock = threading.Lock()
+        self.index_path = os.path.join(root, "index.json")
+        self.opened = time.time()
+        self.entries = None
+
+    def load(self):
+        if self.entries is None:
+            self.entries = {}
+            if os.path.exists(self.index_path):
+                try:
+                    with open(self.index_path, "r", encoding="utf-8") as f:
+                        self.entries = json.load(f)
+                except (OSError, ValueError):
+                    self.entries = {}
+        return self.entries
+
+    def save(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def blob_path(self, sha256):
+        return os.path.join(self.root, sha256)
+
+    def lookup(self, key):
+        with self.lock:
+            entry = self.load().get(key)
+            if entry is None:
+                return None
+            path = self.blob_path(entry["sha256"])
+            if (not os.path.exists(path)
+                    or os.path.getsize(path) != entry["size"]
+                    or sha256_file(path) != entry["sha256"]):
+                del self.entries[key]
+                if os.path.exists(path):
+                    os.remove(path)
+                self.save()
+                return None
+            entry["used"] = time.time()
+            self.save()
+            return path
+
+    def validators(self, key):
+        with self.lock:
+            entry = self.load().get(key)
+            return dict(entry.get("validators", {})) if entry else {}
+
+    def store(self, key, src_path, sha256=None, validators=None):
+        sha256 = sha256 or sha256_file(src_path)
+        with self.lock:
+            self.load()
+            os.makedirs(self.root, exist_ok=True)
+            path = self.blob_path(sha256)
+            if os.path.exists(path):
+                os.remove(src_path)
+            else:
+                shutil.move(src_path, path)
+            self.entries[key] = {"sha256": sha256,
+                                 "size": os.path.getsize(path),
+                                 "used": time.time()}
+            if validators:
+                self.entries[key]["validators"] = validators
+            self.evict()
+            self.save()
+            return path
+
+    def evict(self):
+        blobs = {}
+        for entry in self.entries.values():
+            blobs[entry["sha256"]] = entry["size"]
+        total = sum(blobs.values())
+
+        # entries touched by this run are in use and never evicted
+        for key, entry in sorted(self.entries.items(), key=lambda item: item[1]["used"]):
+            if total <= self.limit or entry["used"] >= self.opened:
+                break
+            del self.entries[key]
+            sha256 = entry["sha256"]
+            if all(e["sha256"] != sha256 for e in self.entries.values()):
+                total -= blobs[sha256]
+                path = self.blob_path(sha256)
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+def conditional_get(session, url, cache, key, metrics=None):
+    """Fetch url into the cache, revalidating a cached copy with its ETag/Last-Modified."""
+    cached = cache.lookup(key)
+    headers = {}
+    if cached:
+        validators = cache.validators(key)
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = session.get(url, headers=headers, timeout=30)
+    if response.status_code == 304 and cached:
+        if metrics:
+            metrics.count("cache_hits")
+        return cached
+    response.raise_for_status()
+    if metrics:
+        metrics.count("bytes", len(response.content))
+
+    os.makedirs(cache.root, exist_ok=True)
+    fd, download_path = tempfile.mkstemp(dir=cache.root, suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(response.content)
+    validators = {"etag": response.headers.get("ETag"),
+                  "last_modified": response.headers.get("Last-Modified")}
+    return cache.store(key, download_path,
+                       validators={k: v for k, v in validators.items() if v})
+
+
+_release_lock = threading.Lock()
+_release_info = {}
+
+
+def fetch_release_info(session=requests, cache=None, tag=None, releases_url=GITHUB_RELEASES,
+                       metrics=None):
+    """Return the metadata of the latest (or the tagged) release, fetched at most once per run."""
+    url = releases_url + ("/tags/" + tag if tag else "/latest")
+    with _release_lock:
+        if url not in _release_info:
+            cache = cache or DownloadCache(CACHE_DIR, CACHE_LIMIT)
+            key = f"release-{tag or 'latest'}.json"
+            with open(conditional_get(session, url, cache, key, metrics), "r", encoding="utf-8") as f:
+                _release_info[url] = json.load(f)
+        return _release_info[url]
+
+
+def release_download_url(downloads_url, tag, name):
+    """Direct link to a release asset; without a tag, GitHub redirects to the latest release."""
+    if tag:
+        return f"{downloads_url}/download/{tag}/{name}"
+    return f"{downloads_url}/latest/download/{name}"
+
+
+def fetch_release_index(session=requests, cache=None, tag=None, downloads_url=GITHUB_DOWNLOADS,
+                        metrics=None):
+    """Release metadata from the release's index asset, in the shape of the API's release JSON.
+
+    The index is written by package_release.py and names the resource zip,
+    the plugin zip and the manifest outright.
+    """
+    url = release_download_url(downloads_url, tag, INDEX_ASSET)
+    with _release_lock:
+        if url not in _release_info:
+            cache = cache or DownloadCache(CACHE_DIR, CACHE_LIMIT)
+            key = f"index-{tag or 'latest'}.json"
+            with open(conditional_get(session, url, cache, key, metrics), "r", encoding="utf-8") as f:
+                index = json.load(f)
+            assets = [dict(asset, browser_download_url=release_download_url(
+                          downloads_url, index["tag_name"], asset["name"]))
+                      for asset in index["assets"]]
+            _release_info[url] = dict(index, assets=assets)
+        return _release_info[url]
+
+
+def fetch_release(session=requests, cache=None, tag=None, releases_url=GITHUB_RELEASES,
+                  downloads_url=GITHUB_DOWNLOADS, metrics=None):
+    """Release metadata from the index asset when the release has one, else from the API.
+
+    The index is a plain download, so it does not count against the API
+    rate limit and is a few hundred bytes instead of the full release JSON.
+    """
+    if downloads_url:
+        try:
+            return fetch_release_index(session, cache, tag, downloads_url, metrics)
+        except (requests.RequestException, ValueError, KeyError):
+            # released before the index existed, or a malformed one
+            pass
+    return fetch_release_info(session, cache, tag, releases_url, metrics)
+
+
+def release_version(data):
+    return data.get("tag_name", "").replace(TAG_PREFIX, "")
+
+
+PROFILE_PRODUCT = re.compile(r"^(AutoCAD|C3D)\b", re.IGNORECASE)
+LISP_BLOCK = re.compile(re.escape(LISP_BEGIN) + r".*?" + re.escape(LISP_END) + r"[^\n]*\n?", re.DOTALL)
+# copies appended by setups that predate the markers
+LEGACY_LISP = re.compile(r"\(defun loadMyCUIX .*?\(defun S::STARTUP \(\)\s*\(loadMyCUIX\)\s*\)\n?", re.DOTALL)
+
+
+def find_support_folders(roaming_appdata):
+    """Every per-user Support folder of the installed AutoCAD based products.
+
+    Covers all releases and locales of plain AutoCAD and its verticals, e.g.
+    Autodesk/AutoCAD 2025/R25.0/deu/Support and Autodesk/C3D 2024/enu/Support.
+    """
+    found = []
+
+    def walk(path, depth):
+        try:
+            entries = [e for e in os.scandir(path) if e.is_dir()]
+        except OSError:
+            return
+        for entry in entries:
+            locale = os.path.basename(path)
+            if entry.name.lower() == "support" and len(locale) == 3 and locale.isalpha():
+                found.append(entry.path)
+            elif depth < 2:
+                walk(entry.path, depth + 1)
+
+    try:
+        products = [e for e in os.scandir(os.path.join(roaming_appdata, "Autodesk"))
+                    if e.is_dir() and PROFILE_PRODUCT.match(e.name)]
+    except OSError:
+        return found
+    for product in products:
+        walk(product.path, 0)
+    return sorted(found)
+
+
+def patch_lisp_block(path, script):
+    """Put script between the setup markers in the lisp file at path.
+
+    An existing block (or an unmarked copy from an older setup) is replaced
+    in place and any duplicates are dropped. Returns False, without touching
+    the file, when it already holds exactly this block.
+    """
+    try:
+        with open(path, "r", encoding="utf-8", errors="surrogateescape", newline="") as f:
+            original = f.read()
+    except FileNotFoundError:
+        original = ""
+
+    kept = []
+
+    def keep_first(match):
+        if kept:
+            return ""
+        kept.append(match)
+        return "\0"
+
+    text = LEGACY_LISP.sub(keep_first, LISP_BLOCK.sub(keep_first, original))
+    block = f"{LISP_BEGIN}\n{script.strip()}\n{LISP_END}\n"
+    if kept:
+        # the BEGIN marker always starts a line of its own
+        text = re.sub(r"(?<=[^\n])\0", "\n\0", text).replace("\0", block)
+    else:
+        text += ("\n" if text and not text.endswith("\n") else "") + block
+    if text == original:
+        return False
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix="acad.lsp.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", errors="surrogateescape", newline="") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return True
+
+
+class DownloadProgress:
+    """Byte-weighted progress shared by all concurrent downloads.
+
+    Workers only bump counters under a lock; readers call snapshot() at their
+    own pace, so the cost per chunk does not depend on the chunk size.
+    """
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+        self.lock = threading.Lock()
+        self.totals = {}
+        self.done = {}
+
+    def expect(self, key, total):
+        with self.lock:
+            if total and not self.totals.get(key):
+                self.totals[key] = total
+            self.done.setdefault(key, 0)
+
+    def advance(self, key, count):
+        with self.lock:
+            self.done[key] = self.done.get(key, 0) + count
+
+    def set(self, key, count):
+        with self.lock:
+            self.done[key] = count
+
+    def snapshot(self):
+        with self.lock:
+            total = sum(self.totals.values())
+            done = sum(min(self.done[k], self.totals.get(k, 0)) for k in self.done)
+        percent = done / total if total else 0
+        return self.start + (self.end - self.start) * percent, done, total
+
+
+class RateMeter:
+    """Smoothed transfer rate and ETA from byte counts sampled by the UI."""
+
+    def __init__(self, smoothing=0.3):
+        self.smoothing = smoothing
+        self.rate = 0.0
+        self.last = None
+
+    def update(self, done, now=None):
+        now = time.monotonic() if now is None else now
+        if self.last is not None and now > self.last[0]:
+            current = max(done - self.last[1], 0) / (now - self.last[0])
+            if self.rate:
+                current = self.smoothing * current + (1 - self.smoothing) * self.rate
+            self.rate = current
+        self.last = (now, done)
+        return self.rate
+
+    def eta(self, remaining):
+        return remaining / self.rate if self.rate > 0 else None
+
+
+class InstallMetrics:
+    """Wall time, network bytes, retries and cache hits for each install phase.
+
+    write() appends one JSON line per phase to install-log.jsonl and replaces
+    last-install.json with a summary of the whole run, so the files from
+    many seats can be collected and compared across machines and releases.
+    """
+
+    COUNTERS = ("bytes", "retries", "cache_hits")
+
+    def __init__(self):
+        self.install_id = uuid.uuid4().hex
+        self.started = time.time()
+        self.clock = time.perf_counter()
+        self.lock = threading.Lock()
+        self.phases = []
+        self.current = None
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        record = dict(phase=name, seconds=0.0, **{c: 0 for c in self.COUNTERS})
+        with self.lock:
+            outer, self.current = self.current, record
+            self.phases.append(record)
+        began = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record["phase_error"] = str(e) or type(e).__name__
+            raise
+        finally:
+            record["seconds"] = time.perf_counter() - began
+            with self.lock:
+                self.current = outer
+
+    def record(self, name, seconds, budget=None):
+        """Add a phase timed outside the installer, e.g. the wizard's time to first window."""
+        record = dict(phase=name, seconds=seconds, **{c: 0 for c in self.COUNTERS})
+        if budget is not None:
+            record.update(budget=budget, over_budget=seconds > budget)
+        with self.lock:
+            self.phases.append(record)
+
+    def count(self, counter, amount=1):
+        with self.lock:
+            if self.current is not None:
+                self.current[counter] += amount
+
+    @staticmethod
+    def throughput(record):
+        seconds = record["seconds"]
+        return round(record["bytes"] / seconds / 1024 ** 2, 3) if seconds and record["bytes"] else None
+
+    def summary(self, **fields):
+        with self.lock:
+            phases = [dict(p, throughput_mb_s=self.throughput(p)) for p in self.phases]
+        totals = dict(seconds=time.perf_counter() - self.clock,
+                      **{c: sum(p[c] for p in phases) for c in self.COUNTERS})
+        totals["throughput_mb_s"] = self.throughput(totals)
+        return dict(install_id=self.install_id,
+                    started=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.started)),
+                    platform=platform.platform(), python=platform.python_version(),
+                    **fields, totals=totals, phases=phases)
+
+    def write(self, folder, **fields):
+        summary = self.summary(**fields)
+        os.makedirs(folder, exist_ok=True)
+
+        log_path = os.path.join(folder, "install-log.jsonl")
+        if os.path.exists(log_path) and os.path.getsize(log_path) > METRICS_LOG_LIMIT:
+            os.replace(log_path, log_path + ".1")
+        with open(log_path, "a", encoding="utf-8") as f:
+            for record in summary["phases"]:
+                f.write(json.dumps(dict(install_id=self.install_id, started=summary["started"],
+                                        **fields, **record)) + "\n")
+
+        summary_path = os.path.join(folder, "last-install.json")
+        with open(summary_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        os.replace(summary_path + ".tmp", summary_path)
+        return summary
+
+
+class InstallPaths:
+    """Filesystem roots the installer writes to.
+
+    default() gives the real Windows locations; under(root) maps all of them
+    below one folder so the pipeline can run in a scratch tree on any OS.
+    """
+
+    def __init__(self, local_appdata, roaming_appdata, plugins):
+        self.local_appdata = local_appdata
+        self.roaming_appdata = roaming_appdata
+        self.plugins = plugins
+        self.bundle = os.path.join(plugins, APP_NAME + ".bundle")
+        self.win64 = os.path.join(self.bundle, "Contents", "Win64")
+
+    @classmethod
+    def default(cls):
+        home = os.path.expanduser("~")
+        return cls(os.environ.get("LOCALAPPDATA", os.path.join(home, "AppData", "Local")),
+                   os.environ.get("APPDATA", os.path.join(home, "AppData", "Roaming")),
+                   os.path.join(os.environ.get("PROGRAMDATA", "C:\\ProgramData"),
+                                "Autodesk", "ApplicationPlugins"))
+
+    @classmethod
+    def under(cls, root):
+        return cls(os.path.join(root, "AppData", "Local"),
+                   os.path.join(root, "AppData", "Roaming"),
+                   os.path.join(root, "ProgramData", "Autodesk", "ApplicationPlugins"))
+
+
+class InstallObserver:
+    """Receives install events from an Installer; override the ones you need.
+
+    Callbacks run on the install thread (on_progress possibly on download
+    workers), so UI code has to hand them over to its own thread.
+    """
+
+    def on_status(self, text):
+        pass
+
+    def on_progress(self, percent):
+        pass
+
+    def on_finished(self, version):
+        pass
+
+    def on_failed(self, error):
+        pass
+
+
+class Installer:
+    """Install pipeline shared by the setup wizard and the silent command line.
+
+    Everything it touches is injectable: filesystem roots (paths), the HTTP
+    session and the release/cuix endpoints. Front ends subscribe an
+    InstallObserver and call cancel() to stop every transfer in flight.
+
+    With a mirror (an http(s) base URL or a local/UNC folder) every file the
+    mirror holds an identical copy of is fetched from there instead of
+    GitHub. A folder mirror is also filled with what this seat had to
+    download, so the next seat finds it there.
+    """
+
+    # =====================================================
+    # INIT
+    # =====================================================
+
+    def __init__(self, version="", tag=None, paths=None, session=None,
+                 releases_url=GITHUB_RELEASES, cuix_url=CUIX_URL,
+                 data_dir=SETUP_DATA_DIR, workers=DOWNLOAD_WORKERS, mirror=MIRROR,
+                 downloads_url=GITHUB_DOWNLOADS):
+        self.version = version
+        self.tag = tag
+        self.paths = paths or InstallPaths.default()
+        self.session = session
+        self.releases_url = releases_url
+        self.downloads_url = downloads_url
+        self.cuix_url = cuix_url
+        self.mirror = mirror_url(mirror) if mirror else None
+        self.mirrored = None
+        self.mirror_failed = set()
+        self.release = None
+        self.download_dir = os.path.join(data_dir, "downloads")
+        self.cache_dir = os.path.join(data_dir, "cache")
+        self.metrics_dir = os.path.join(data_dir, "metrics")
+        self.workers = workers
+
+        self.observers = []
+        self.cancel_event = threading.Event()
+        self.percent = 0
+        self.transfer = None
+        self.metrics = InstallMetrics()
+        self.cache = None
+        self.staging = []
+        self.swapped = []
+
+    # =====================================================
+    # EVENTS
+    # =====================================================
+
+    def subscribe(self, observer):
+        self.observers.append(observer)
+
+    def update_status(self, text):
+        for observer in self.observers:
+            observer.on_status(text)
+
+    def update_progress(self, value):
+        self.percent = value
+        for observer in self.observers:
+            observer.on_progress(value)
+
+    def track(self, start, end):
+        self.transfer = DownloadProgress(start, end)
+        return self.transfer
+
+    def snapshot(self):
+        """Latest (percent, bytes done, bytes total); cheap enough to poll every frame."""
+        transfer = self.transfer
+        if transfer is None:
+            return self.percent, 0, 0
+        return transfer.snapshot()
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def run(self):
+        """Install, roll back on failure and tell the observers; returns True on success."""
+        try:
+            self.download_and_install()
+        except Exception as e:
+            self.rollback()
+            self.write_metrics(ok=False, error=str(e) or type(e).__name__)
+            for observer in self.observers:
+                observer.on_failed(e)
+            return False
+        self.write_metrics(ok=True, error=None)
+        self.update_progress(100)
+        for observer in self.observers:
+            observer.on_finished(self.version)
+        return True
+
+    def connect(self):
+        if self.session is None:
+            self.session = create_session(self.workers * DOWNLOAD_SEGMENTS)
+        if self.cache is None:
+            self.cache = DownloadCache(self.cache_dir, CACHE_LIMIT)
+
+    def write_metrics(self, **fields):
+        # diagnostics only: a full disk or locked log must not fail the install
+        try:
+            self.metrics.write(self.metrics_dir, version=self.version, **fields)
+        except OSError:
+            pass
+
+    # =====================================================
+    # DOWNLOAD WITH REAL PROGRESS
+    # =====================================================
+
+    def download_file(self, url, path, progress, key, size=0, cache_key=None, sha256=None, extractor=None):
+        """Download url to path (or into the cache) and check it against size and sha256.
+
+        The hash is computed from the chunks as they are written; only
+        segmented downloads, which arrive out of order, hash the finished file.
+        """
+        if cache_key:
+            cached = self.cache.lookup(cache_key)
+            # blobs are named after their hash, so a stale entry is a plain name check
+            if cached and (not VERIFY_DOWNLOADS or not sha256 or os.path.basename(cached) == sha256):
+                self.metrics.count("cache_hits")
+                progress.expect(key, os.path.getsize(cached))
+                progress.set(key, os.path.getsize(cached))
+                return cached
+
+        os.makedirs(self.download_dir, exist_ok=True)
+        part_path = self.part_path(url, size, sha256)
+        state_path = part_path + ".json"
+        digest = StreamDigest() if VERIFY_DOWNLOADS else None
+        resumed = os.path.exists(part_path)
+
+        segmented = os.path.exists(state_path) or (
+            size >= SEGMENT_THRESHOLD and not os.path.exists(part_path))
+        if segmented:
+            try:
+                self.download_segmented(url, part_path, state_path, size, progress, key)
+            except RangeNotSupported:
+                for leftover in (part_path, state_path):
+                    if os.path.exists(leftover):
+                        os.remove(leftover)
+                segmented = False
+        if not segmented:
+            self.with_retries(self.download_stream, url, part_path, progress, key, extractor, digest)
+
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        actual = None
+        if digest is not None:
+            actual = sha256_file(part_path) if segmented else digest.hexdigest()
+            try:
+                self.verify_download(url, part_path, size, sha256, actual)
+            except IntegrityError:
+                if not resumed:
+                    raise
+                # the partial did not belong to this file after all (no published
+                # digest, or the asset was replaced); it is gone now, so start over once
+                if extractor is not None:
+                    extractor.abort()
+                return self.download_file(url, path, progress, key, size, cache_key, sha256, extractor)
+        if cache_key:
+            return self.cache.store(cache_key, part_path, actual)
+        shutil.move(part_path, path)
+        return path
+
+    def part_path(self, url, size=0, sha256=None):
+        # a mirror serves every release's zip at the same URL, so the size and digest
+        # go into the name too: a partial of another release is never resumed
+        identity = f"{url}\n{size}\n{sha256 or ''}"
+        name = hashlib.sha1(identity.encode("utf-8")).hexdigest()[:16] + "-" + os.path.basename(url)
+        return os.path.join(self.download_dir, name + ".part")
+
+    def prune_partials(self, jobs):
+        """Delete partial downloads (and their segment state) that none of jobs would resume."""
+        keep = set()
+        for url, _, size, _, sha256, *_ in jobs:
+            for source in (url, self.github_url(url)):
+                if source:
+                    part_path = self.part_path(source, size, sha256)
+                    keep.update((part_path, part_path + ".json"))
+        try:
+            names = os.listdir(self.download_dir)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self.download_dir, name)
+            if name.endswith((".part", ".part.json")) and path not in keep:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def verify_download(self, url, part_path, size, sha256, actual):
+        # a bad file is dropped so the next attempt starts from scratch
+        problem = None
+        if size and os.path.getsize(part_path) != size:
+            problem = f"expected {size} bytes, got {os.path.getsize(part_path)}"
+        elif sha256 and actual != sha256:
+            problem = f"SHA-256 {actual} does not match the published {sha256}"
+        if problem:
+            os.remove(part_path)
+            raise IntegrityError(f"{os.path.basename(url)} is corrupt: {problem}.")
+
+    def with_retries(self, func, *args):
+        for attempt in range(MAX_RETRIES):
+            try:
+                return func(*args)
+            except (requests.RequestException, IncompleteDownload) as e:
+                if attempt == MAX_RETRIES - 1 or not is_transient(e):
+                    raise
+            self.metrics.count("retries")
+            if self.cancel_event.wait(RETRY_BACKOFF * 2 ** attempt):
+                raise InstallCancelled("Installation cancelled.")
+
+    def download_stream(self, url, part_path, progress, key, extractor=None, digest=None):
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        sinks = [sink for sink in (extractor, digest) if sink is not None]
+
+        with self.session.get(url, stream=True, timeout=30, headers=headers) as r:
+            if r.status_code == 416:
+                # the partial file already holds every byte the server has
+                self.feed_extractor(sinks, part_path, offset)
+                return
+            r.raise_for_status()
+            if r.status_code != 206:
+                offset = 0
+            self.feed_extractor(sinks, part_path, offset)
+            length = int(r.headers.get("content-length", 0))
+            total = offset + length if length else 0
+            progress.expect(key, total)
+            progress.set(key, offset)
+
+            written = offset
+            try:
+                with open(part_path, "ab" if offset else "wb") as f:
+                    for chunk in r.iter_content(CHUNK_SIZE):
+                        if self.cancel_event.is_set():
+                            raise InstallCancelled("Installation cancelled.")
+                        if chunk:
+                            f.write(chunk)
+                            for sink in sinks:
+                                if sink.fed < written + len(chunk):
+                                    sink.feed(chunk[sink.fed - written:])
+                            written += len(chunk)
+                            progress.advance(key, len(chunk))
+            finally:
+                self.metrics.count("bytes", written - offset)
+
+        if total and written != total:
+            raise IncompleteDownload(f"Expected {total} bytes, got {written}.")
+
+    def feed_extractor(self, sinks, part_path, offset):
+        # catch the extractor and digest up with bytes already on disk from an earlier attempt
+        for sink in sinks:
+            if sink.fed >= offset:
+                continue
+            with open(part_path, "rb") as f:
+                f.seek(sink.fed)
+                while sink.fed < offset:
+                    if self.cancel_event.is_set():
+                        raise InstallCancelled("Installation cancelled.")
+                    sink.feed(f.read(min(1024 * 1024, offset - sink.fed)))
+
+    def download_segmented(self, url, part_path, state_path, size, progress, key):
+        segments = None
+        if os.path.exists(state_path) and os.path.exists(part_path):
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("size") == size:
+                segments = state["segments"]
+
+        if segments is None:
+            with self.session.get(url, stream=True, timeout=30, headers={"Range": "bytes=0-0"}) as r:
+                if r.status_code != 206:
+                    raise RangeNotSupported(url)
+            step = -(-size // DOWNLOAD_SEGMENTS)
+            segments = [[s, min(s + step, size), s] for s in range(0, size, step)]
+            with open(part_path, "wb") as f:
+                f.truncate(size)
+
+        def save_state():
+            with open(state_path, "w", encoding="utf-8") as f:
+                json.dump({"size": size, "segments": segments}, f)
+
+        save_state()
+        progress.expect(key, size)
+        progress.set(key, sum(pos - start for start, _, pos in segments))
+
+        try:
+            self.run_parallel(
+                lambda seg: self.with_retries(self.download_range, url, part_path, seg, progress, key),
+                [seg for seg in segments if seg[2] < seg[1]],
+                DOWNLOAD_SEGMENTS)
+        finally:
+            save_state()
+
+    def download_range(self, url, part_path, segment, progress, key):
+        start, end, pos = segment
+        headers = {"Range": f"bytes={pos}-{end - 1}"}
+
+        with self.session.get(url, stream=True, timeout=30, headers=headers) as r:
+            r.raise_for_status()
+            if r.status_code != 206:
+                raise IncompleteDownload(f"Server ignored range request for {url}.")
+
+            try:
+                with open(part_path, "r+b") as f:
+                    f.seek(pos)
+                    for chunk in r.iter_content(CHUNK_SIZE):
+                        if self.cancel_event.is_set():
+                            raise InstallCancelled("Installation cancelled.")
+                        if chunk:
+                            chunk = chunk[:end - segment[2]]
+                            f.write(chunk)
+                            segment[2] += len(chunk)
+                            progress.advance(key, len(chunk))
+            finally:
+                self.metrics.count("bytes", segment[2] - pos)
+
+        if segment[2] != end:
+            raise IncompleteDownload(f"Range {start}-{end} stopped at {segment[2]}.")
+
+    def run_parallel(self, func, items, workers):
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+            futures = [pool.submit(func, item) for item in items]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            failed = [f for f in done if f.exception() is not None]
+            if failed:
+                # stop the remaining transfers before surfacing the error
+                self.cancel_event.set()
+                for f in pending:
+                    f.cancel()
+                wait(pending)
+                raise failed[0].exception()
+            return [f.result() for f in futures]
+
+    def download_assets(self, jobs, start, end):
+        progress = self.track(start, end)
+        for url, path, size, *_ in jobs:
+            progress.expect(url, size)
+        # partials of an older release or a dropped asset would otherwise stay forever
+        self.prune_partials(jobs)
+
+        def download(job):
+            url, path, *rest = job
+            extractor = rest[3] if len(rest) > 3 else None
+
+            def attempt(source):
+                if source != url and extractor is not None:
+                    # the mirror's bytes already went in: extract the GitHub copy with zipfile
+                    extractor.abort()
+                return self.download_file(source, path, progress, url, *rest)
+            return self.or_from_github(attempt, url)
+
+        try:
+            paths = self.run_parallel(download, jobs, self.workers)
+        finally:
+            self.transfer = None
+        self.update_progress(end)
+        return paths
+
+    def install_assets(self, jobs, start, end):
+        """Download each (url, path, size, cache_key, sha256, dest) and extract it into dest.
+
+        path may be None for jobs with a cache_key: the download then stays in the cache.
+
+        Members are unpacked while the download streams in; archives that
+        could not be streamed (cache hits, segmented downloads, layouts that
+        need the central directory) are extracted from the finished files
+        with extract_archives.
+        """
+        extractors = [StreamingZipExtractor(dest) for *_, dest in jobs]
+        with self.metrics.phase("download"):
+            paths = self.download_assets(
+                [job[:5] + (extractor,) for job, extractor in zip(jobs, extractors)], start, end)
+
+        pending = [(path, extractor.dest) for path, extractor in zip(paths, extractors)
+                   if not extractor.complete]
+        if pending:
+            self.update_status("Extracting files...")
+            with self.metrics.phase("extract"):
+                self.extract_archives(pending)
+        return paths
+
+    def extract_archives(self, archives):
+        """Extract each (zip path, dest) on the worker pool.
+
+        Members of all archives are spread across workers by compressed size,
+        and every worker reads through its own ZipFile handles. Output files
+        are preallocated to the size recorded in the central directory; files
+        that already match in size and CRC are left alone.
+        """
+        members = []
+        for path, dest in archives:
+            with zipfile.ZipFile(path) as z:
+                members.extend((path, dest, info) for info in z.infolist())
+        # inflating is CPU bound: more threads than cores only adds contention
+        workers = min(self.workers, os.cpu_count() or 1, len(members))
+        batches = [[] for _ in range(max(1, workers))]
+        loads = [0] * len(batches)
+        for member in sorted(members, key=lambda m: m[2].compress_size, reverse=True):
+            slot = loads.index(min(loads))
+            batches[slot].append(member)
+            loads[slot] += member[2].compress_size + 1
+        self.run_parallel(self.extract_members, batches, len(batches))
+
+    def extract_members(self, members):
+        handles = {}
+        try:
+            for path, dest, info in members:
+                if self.cancel_event.is_set():
+                    raise InstallCancelled("Installation cancelled.")
+                target = member_path(dest, info.filename)
+                if info.is_dir():
+                    os.makedirs(target, exist_ok=True)
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                if (os.path.isfile(target) and os.path.getsize(target) == info.file_size
+                        and crc32_file(target) == info.CRC):
+                    continue
+                if path not in handles:
+                    handles[path] = zipfile.ZipFile(path)
+                with handles[path].open(info) as src, open(target + ".tmp", "wb") as f:
+                    f.truncate(info.file_size)
+                    for block in iter(lambda: src.read(shutil.COPY_BUFSIZE), b""):
+                        if self.cancel_event.is_set():
+                            raise InstallCancelled("Installation cancelled.")
+                        f.write(block)
+                os.replace(target + ".tmp", target)
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+    # =====================================================
+    # MIRROR
+    # =====================================================
+
+    def load_mirror(self):
+        """The release index of the mirror, or None when there is no usable mirror."""
+        if not self.mirror:
+            return None
+        try:
+            r = self.session.get(f"{self.mirror}/{MIRROR_INDEX}", timeout=10)
+            r.raise_for_status()
+            return r.json()
+        except (requests.RequestException, ValueError):
+            return None
+
+    def mirror_asset(self, asset, mirrored):
+        """asset pointed at the mirror if it holds this exact file, else unchanged.
+
+        GitHub's URL is kept as github_url, for when the mirror's copy fails.
+        """
+        sha256 = asset_sha256(asset)
+        for copy in (mirrored or {}).get("assets", []):
+            if (copy["name"] == asset["name"] and copy.get("size") == asset.get("size")
+                    and asset_sha256(copy) == sha256
+                    and (sha256 or copy.get("id") == asset.get("id"))):
+                mirrored_asset = dict(asset, browser_download_url=
+                                      f"{self.mirror}/{urllib.parse.quote(asset['name'])}")
+                if asset.get("browser_download_url"):
+                    mirrored_asset["github_url"] = asset["browser_download_url"]
+                return mirrored_asset
+        return asset
+
+    def github_url(self, url):
+        """GitHub's URL for an asset that was pointed at the mirror, else None."""
+        for asset in (self.release or {}).get("assets", []):
+            if asset["browser_download_url"] == url:
+                return asset.get("github_url")
+        return None
+
+    def or_from_github(self, func, url):
+        """func(url); if url is a mirror copy that is missing, cut off or corrupt, func(GitHub's url)."""
+        try:
+            return func(url)
+        except (requests.RequestException, IntegrityError, DeltaUnavailable):
+            fallback = self.github_url(url)
+            if fallback is None:
+                raise
+            self.mirror_failed.add(url)
+            return func(fallback)
+
+    def from_mirror(self, url):
+        return bool(self.mirror) and url.startswith(self.mirror + "/") and url not in self.mirror_failed
+
+    def share_with_mirror(self, data, files):
+        # best effort: a read-only or unreachable share must not fail the install
+        folder = mirror_folder(self.mirror)
+        if not folder or self.tag or not files:
+            return
+        try:
+            publish_release(folder, data, files)
+        except OSError:
+            pass
+
+    # =====================================================
+    # DELTA UPDATE
+    # =====================================================
+
+    def delta_update(self, manifest, jobs, assets, start, end):
+        """Populate each (asset, dest, reuse_roots) from the manifest.
+
+        Files that already match are left alone, files found elsewhere in the
+        installed tree are copied, and only the rest are read out of the
+        release zip with ranged requests (or from a per-file release asset).
+        """
+        plans = []
+        for asset, dest, reuse_roots in jobs:
+            entries = manifest.get("archives", {}).get(asset["name"])
+            if entries is None:
+                raise DeltaUnavailable(f"No manifest entries for {asset['name']}.")
+            plans.append((asset, dest, entries, LocalFileIndex(
+                root for root in reuse_roots if os.path.isdir(root))))
+
+        progress = self.track(start, end)
+        fetches = []
+        for asset, dest, entries, local_files in plans:
+            missing = []
+            for entry in entries:
+                if self.cancel_event.is_set():
+                    raise InstallCancelled("Installation cancelled.")
+                target = member_path(dest, entry["path"])
+                if entry["path"].endswith("/"):
+                    os.makedirs(target, exist_ok=True)
+                    continue
+                if file_matches(target, entry):
+                    continue
+                source = local_files.find(entry)
+                if source:
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    shutil.copyfile(source, target + ".tmp")
+                    os.replace(target + ".tmp", target)
+                    continue
+                missing.append(entry)
+                progress.expect(entry["path"], entry["size"])
+            if missing:
+                fetches.append((asset, dest, missing))
+
+        try:
+            for asset, dest, missing in fetches:
+                self.or_from_github(
+                    lambda url: self.fetch_members(dict(asset, browser_download_url=url), dest, missing,
+                                                   assets, progress),
+                    asset["browser_download_url"])
+        finally:
+            self.transfer = None
+        self.update_progress(end)
+
+    def fetch_members(self, asset, dest, entries, assets, progress):
+        """Write each manifest entry into dest from the release zip or its own asset.
+
+        Range reads and per-file downloads are retried like full downloads;
+        anything that still fails raises DeltaUnavailable, so the caller falls
+        back to installing the whole archive.
+        """
+        archive = remote = None
+        try:
+            for entry in entries:
+                target = member_path(dest, entry["path"])
+                # written by an earlier attempt, before falling back from the mirror
+                if file_matches(target, entry):
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                if entry.get("asset"):
+                    if entry["asset"] not in assets:
+                        raise DeltaUnavailable(f"Asset {entry['asset']} not in release.")
+                    self.or_from_github(
+                        lambda url: self.with_retries(self.fetch_member_asset, url, entry, target, progress),
+                        assets[entry["asset"]]["browser_download_url"])
+                    continue
+                if archive is None:
+                    remote = HttpRangeFile(self.session, asset["browser_download_url"],
+                                           asset["size"], self.cancel_event, self.with_retries)
+                    archive = zipfile.ZipFile(io.BufferedReader(remote, 256 * 1024))
+                self.write_member(archive.open(entry["path"]), entry, target, progress)
+        except (RangeNotSupported, KeyError, zipfile.BadZipFile, IntegrityError,
+                requests.RequestException, IncompleteDownload) as e:
+            raise DeltaUnavailable(str(e) or type(e).__name__)
+        finally:
+            if archive is not None:
+                archive.close()
+            if remote is not None:
+                self.metrics.count("bytes", remote.transferred)
+
+    def fetch_member_asset(self, url, entry, target, progress):
+        with self.session.get(url, stream=True, timeout=30) as src:
+            src.raise_for_status()
+            src.raw.decode_content = True
+            self.write_member(src.raw, entry, target, progress)
+            self.metrics.count("bytes", src.raw.tell())
+
+    def write_member(self, reader, entry, target, progress):
+        # a retry starts the file over, so its progress does too
+        progress.set(entry["path"], 0)
+        digest = hashlib.sha256()
+        with reader, open(target + ".tmp", "wb") as f:
+            for block in iter(lambda: reader.read(CHUNK_SIZE * 8), b""):
+                if self.cancel_event.is_set():
+                    raise InstallCancelled("Installation cancelled.")
+                digest.update(block)
+                f.write(block)
+                progress.advance(entry["path"], len(block))
+        if digest.hexdigest() != entry["sha256"]:
+            os.remove(target + ".tmp")
+            raise IntegrityError(f"{entry['path']} does not match the manifest.")
+        os.replace(target + ".tmp", target)
+
+    # =====================================================
+    # STAGING
+    # =====================================================
+
+    def reset_dir(self, path):
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.makedirs(path)
+
+    def verify_bundle(self, bundle):
+        root = ET.parse(os.path.join(bundle, "PackageContents.xml")).getroot()
+        for entry in root.iter("ComponentEntry"):
+            module = os.path.join(bundle, entry.attrib["ModuleName"])
+            if not os.path.isfile(module):
+                raise Exception(f"Staged bundle is missing {entry.attrib['ModuleName']}.")
+
+    def swap_in(self, staged, target):
+        """Replace target with staged by renaming, keeping the old copy at target.previous."""
+        previous = target + ".previous"
+        if os.path.exists(previous):
+            shutil.rmtree(previous)
+        existed = os.path.exists(target)
+        if existed:
+            os.rename(target, previous)
+        self.swapped.append((target, existed))
+        os.rename(staged, target)
+
+    def restore_previous(self, target, existed=True):
+        """Undo swap_in: put target.previous back, or remove target if there was nothing before."""
+        previous = target + ".previous"
+        if existed and not os.path.exists(previous):
+            return
+        if os.path.exists(target):
+            shutil.rmtree(target)
+        if existed:
+            os.rename(previous, target)
+
+    # =====================================================
+    # MAIN INSTALL PROCESS
+    # =====================================================
+
+    def download_and_install(self):
+
+        local_appdata = self.paths.local_appdata
+        programdata = self.paths.plugins
+        bundle_path = self.paths.bundle
+        win64_path = self.paths.win64
+
+        self.connect()
+
+        self.update_status("Fetching release info...")
+        data = self.release_info()
+        self.resolve_version()
+
+        assets = {asset["name"]: asset for asset in data["assets"]}
+        # the index names the archives; API metadata has to be searched by name
+        plugin_name = data.get("plugin") or next(
+            (name for name in assets if name.startswith(TAG_PREFIX)), None)
+        zip1 = assets.get(data.get("resources", RESOURCE_DIR + ".zip"))
+        zip2 = assets.get(plugin_name)
+        manifest_asset = assets.get(data.get("manifest", MANIFEST_ASSET))
+
+        if not zip1 or not zip2:
+            raise Exception("Release assets not found.")
+
+        shared = {}
+        manifest = None
+        if manifest_asset and (os.path.exists(win64_path)
+                               or not (asset_sha256(zip1) and asset_sha256(zip2))):
+            with self.metrics.phase("metadata"):
+                manifest_path = self.or_from_github(
+                    lambda url: conditional_get(self.session, url, self.cache,
+                                                asset_cache_key(manifest_asset), self.metrics),
+                    manifest_asset["browser_download_url"])
+                with open(manifest_path, "r", encoding="utf-8") as f:
+                    manifest = json.load(f)
+            if not self.from_mirror(manifest_asset["browser_download_url"]):
+                shared[MANIFEST_ASSET] = manifest_path
+
+        staging_bundle = bundle_path + ".staging"
+        staging_win64 = os.path.join(staging_bundle, "Contents", "Win64")
+        staging_resources = os.path.join(local_appdata, RESOURCE_DIR + ".staging")
+        self.staging = [staging_bundle, staging_resources]
+        self.reset_dir(staging_win64)
+        self.reset_dir(staging_resources)
+
+        updated = False
+        if manifest and os.path.exists(win64_path):
+            self.update_status("Updating changed files...")
+            try:
+                with self.metrics.phase("delta"):
+                    self.delta_update(manifest, [
+                        (zip1, staging_resources, [os.path.join(local_appdata, RESOURCE_DIR)]),
+                        (zip2, staging_win64, [win64_path]),
+                    ], assets, 0, 80)
+                updated = True
+            except DeltaUnavailable:
+                self.reset_dir(staging_win64)
+                self.reset_dir(staging_resources)
+
+        if not updated:
+            # a corrupt archive fails here, while it is still only in the staging folders
+            self.update_status("Downloading resources and plugin...")
+            paths = self.install_assets([
+                (zip1["browser_download_url"], None, zip1.get("size", 0), asset_cache_key(zip1),
+                 asset_sha256(zip1, manifest), staging_resources),
+                (zip2["browser_download_url"], None, zip2.get("size", 0), asset_cache_key(zip2),
+                 asset_sha256(zip2, manifest), staging_win64),
+            ], 0, 80)
+            for asset, path in zip((zip1, zip2), paths):
+                if not self.from_mirror(asset["browser_download_url"]):
+                    shared[asset["name"]] = path
+
+        self.update_status("Writing PackageContents.xml...")
+        with self.metrics.phase("package_xml"):
+            self.write_full_package_xml(staging_bundle)
+            config_path = os.path.join(bundle_path, CONFIG_FILE)
+            if os.path.exists(config_path):
+                shutil.copyfile(config_path, os.path.join(staging_bundle, CONFIG_FILE))
+            self.verify_bundle(staging_bundle)
+
+        # the plugin is only unavailable between these renames
+        self.update_status("Switching to the new version...")
+        with self.metrics.phase("swap"):
+            self.swap_in(staging_bundle, bundle_path)
+            for name in os.listdir(staging_resources):
+                self.swap_in(os.path.join(staging_resources, name), os.path.join(local_appdata, name))
+            os.rmdir(staging_resources)
+
+        with self.metrics.phase("cuix"):
+            cuix = self.download_cuix(programdata)
+            if cuix:
+                shared[CUIX_NAME] = cuix
+            self.share_with_mirror(data, shared)
+        with self.metrics.phase("lisp") as record:
+            record.update(self.write_cuix_autoload_lisp(programdata))
+
+    # =====================================================
+    # FULL XML
+    # =====================================================
+
+    def write_full_package_xml(self, bundle_path):
+
+        xml_content = f"""<?xml version="1.0" encoding="utf-8"?>
+<ApplicationPackage
+    SchemaVersion="1.0"
+    AutodeskProduct="AutoCAD|Civil3D"
+    Name="{APP_NAME}"
+    Description="Street View Locate Plugin for AutoCAD/CIVIL 3D"
+    AppVersion="{self.version}"
+    Author="Suman Kumar"
+    ProductType="Application">
+
+  <CompanyDetails Name="BHUTUU Technologies" Url="https://github.com/BHUTUU" />
+
+  <Components>
+
+    <RuntimeRequirements
+        OS="Win64"
+        SeriesMin="R24.2"
+        SeriesMax="R25.1" />
+
+    <ComponentEntry
+        AppName="{APP_NAME}"
+        ModuleName="./Contents/Win64/StreetViewLocate_V{self.version}/StreetViewLocate.dll"
+        AppDescription="StreetView Locate"
+        LoadOnAutoCADStartup="True" />
+
+  </Components>
+
+</ApplicationPackage>
+"""
+
+        with open(os.path.join(bundle_path, "PackageContents.xml"), "w", encoding="utf-8") as f:
+            f.write(xml_content)
+
+    # =====================================================
+    # DOWNLOAD CUIX
+    # =====================================================
+
+    def download_cuix(self, programdata):
+        """Install bhutuu.cuix; returns the downloaded copy if it came from GitHub."""
+        self.update_status("Downloading customization file...")
+        cached = None
+        if self.mirrored and self.mirrored.get("cuix"):
+            try:
+                cached = conditional_get(self.session, f"{self.mirror}/{self.mirrored['cuix']}",
+                                         self.cache, "mirror-" + CUIX_NAME, self.metrics)
+            except requests.RequestException:
+                cached = None
+        fetched = None
+        if cached is None:
+            try:
+                cached = fetched = conditional_get(self.session, self.cuix_url, self.cache, CUIX_NAME,
+                                                   self.metrics)
+            except requests.RequestException:
+                raise Exception("Failed to download cuix file.")
+
+        cuix_path = os.path.join(programdata, CUIX_NAME)
+        if os.path.exists(cuix_path):
+            os.remove(cuix_path)
+        shutil.copyfile(cached, cuix_path)
+        return fetched
+
+    # =====================================================
+    # CUIX AUTOLOAD LISP
+    # =====================================================
+
+    def write_cuix_autoload_lisp(self, programdata):
+        self.update_status("Configuring AutoCAD to load customization...")
+        cuix_path = os.path.join(programdata, CUIX_NAME).replace("\\", "\\\\")
+        cui_autoload_script = f"""
+(defun loadMyCUIX ( / cuixName cuixPath loaded )
+
+  ;;<<<-----------set your cuix group name----------->>>
+  (setq cuixName "BHUTUU")
+
+  ;;<<<-----------full path----------->>>
+  (setq cuixPath "{cuix_path}")
+
+  ;;<<<-----------get loaded menu groups----------->>>
+  (vl-load-com)
+  (setq loaded nil)
+
+  (vlax-for g (vla-get-MenuGroups (vlax-get-acad-object))
+    (if (= (strcase (vla-get-Name g)) (strcase cuixName))
+      (setq loaded T)
+    )
+  )
+
+  ;;<<<-----------load if not loaded----------->>>
+  (if (not loaded)
+    (progn
+      (command "_.cuiload" cuixPath)
+      (princ (strcat "\\nLoaded CUIX: " cuixName))
+    )
+    (princ (strcat "\\nCUIX already loaded: " cuixName))
+  )
+
+  (princ)
+)
+;;<<<-----------RUN AT CORRECT TIME----------->>>
+(defun S::STARTUP ()
+  (loadMyCUIX)
+)"""
+        folders = find_support_folders(self.paths.roaming_appdata)
+        patched = self.run_parallel(
+            lambda folder: patch_lisp_block(os.path.join(folder, "acad.lsp"), cui_autoload_script),
+            folders, self.workers)
+        return {"profiles": len(folders), "patched": sum(patched)}
+
+    # =====================================================
+    # VERSION CHECK
+    # =====================================================
+
+    def is_already_installed(self):
+        path = os.path.join(self.paths.bundle, "PackageContents.xml")
+        if not os.path.exists(path):
+            return False
+
+        tree = ET.parse(path)
+        root = tree.getroot()
+        version = root.attrib.get("AppVersion")
+
+        return version == self.version
+
+    # =====================================================
+    # ROLLBACK
+    # =====================================================
+
+    def rollback(self):
+        for path in self.staging:
+            if os.path.exists(path):
+                shutil.rmtree(path)
+        while self.swapped:
+            self.restore_previous(*self.swapped.pop())
+
+    # =====================================================
+    # LATEST RELEASE VERSION GET
+    # =====================================================
+
+    def release_info(self):
+        """Metadata of the release to install, fetched once over this installer's session and cache.
+
+        Assets the mirror holds point at the mirror, and when GitHub cannot be
+        reached the mirror's copy of the release is used as it is.
+        """
+        if self.release is None:
+            self.connect()
+            with self.metrics.phase("metadata"):
+                mirrored = self.load_mirror()
+                try:
+                    data = fetch_release(self.session, self.cache, self.tag, self.releases_url,
+                                         self.downloads_url, self.metrics)
+                except requests.RequestException:
+                    # GitHub unreachable or rate limited: the mirror's release will do
+                    if not mirrored or (self.tag and mirrored.get("tag_name") != self.tag):
+                        raise
+                    data = mirrored
+                if mirrored and mirrored.get("tag_name") == data.get("tag_name"):
+                    self.mirrored = mirrored
+                self.release = dict(data, assets=[self.mirror_asset(a, mirrored) for a in data["assets"]])
+        return self.release
+
+    def resolve_version(self):
+        """The version to install: the one asked for, else the release's."""
+        if not self.version:
+            self.version = release_version(self.release_info())
+        return self.version
@@ -0,0 +1,156 @@
+"""Serve the latest release to the other seats of an office.
+
+    setup.exe --serve-mirror [--mirror-dir D:\\svl-mirror] [--port 8750] [--refresh 900]
+
+This machine downloads the release zips, the manifest and bhutuu.cuix from
+GitHub once, keeps them in --mirror-dir and serves that folder over HTTP.
+Seats installing with --mirror http://<this machine>:8750 (or with the
+STREETVIEWLOCATE_MIRROR environment variable) then fetch everything from
+here and only fall back to GitHub for files the mirror does not have.
+"""
+import argparse
+import http.server
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import urllib.parse
+
+from installer import (Installer, DownloadProgress, CUIX_NAME, MIRROR_INDEX, SETUP_DATA_DIR,
+                       asset_cache_key, asset_sha256, conditional_get, publish_release)
+
+DEFAULT_PORT = 8750
+DEFAULT_REFRESH = 15 * 60
+
+
+def sync_mirror(folder, installer):
+    """Bring folder up to date with the latest GitHub release; returns its tag."""
+    installer.connect()
+    # not fetch_release_info: that one is memoized for the lifetime of the process
+    with open(conditional_get(installer.session, installer.releases_url + "/latest",
+                              installer.cache, "release-latest.json"), "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    files = {}
+    progress = DownloadProgress(0, 100)
+    for asset in data["assets"]:
+        files[asset["name"]] = installer.download_file(
+            asset["browser_download_url"], None, progress, asset["name"], asset.get("size", 0),
+            asset_cache_key(asset), asset_sha256(asset))
+    files[CUIX_NAME] = conditional_get(installer.session, installer.cuix_url, installer.cache, CUIX_NAME)
+    publish_release(folder, data, files)
+    return data.get("tag_name")
+
+
+class MirrorHandler(http.server.BaseHTTPRequestHandler):
+    """Serves the files published in the mirror folder, with Range support."""
+
+    protocol_version = "HTTP/1.1"
+    folder = None
+
+    def log_message(self, format, *args):
+        sys.stderr.write("%s %s\n" % (self.address_string(), format % args))
+
+    def published(self):
+        """Names this mirror serves: its index, the cuix and the assets the index lists."""
+        names = {MIRROR_INDEX, CUIX_NAME}
+        try:
+            with open(os.path.join(self.folder, MIRROR_INDEX), "r", encoding="utf-8") as f:
+                names.update(asset["name"] for asset in json.load(f).get("assets", []))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+        return names
+
+    def do_GET(self):
+        name = urllib.parse.unquote(self.path.split("?")[0].lstrip("/"))
+        # only listed names, never a path: "C:secret" or "..\\x" must not leave the folder
+        path = os.path.join(self.folder, name)
+        if (name not in self.published() or os.path.basename(name) != name
+                or os.path.dirname(os.path.abspath(path)) != os.path.abspath(self.folder)
+                or not os.path.isfile(path)):
+            self.send_error(404)
+            return
+
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            start, end = 0, size
+            match = re.match(r"bytes=(\d+)-(\d*)$", self.headers.get("Range", ""))
+            if match:
+                start = int(match.group(1))
+                end = min(int(match.group(2)) + 1, size) if match.group(2) else size
+                if start >= size:
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{end - 1}/{size}")
+            else:
+                self.send_response(200)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(end - start))
+            self.send_header("Cache-Control", "no-cache" if name == MIRROR_INDEX else "max-age=300")
+            self.end_headers()
+
+            f.seek(start)
+            left = end - start
+            while left > 0:
+                block = f.read(min(shutil.COPY_BUFSIZE, left))
+                if not block:
+                    break
+                self.wfile.write(block)
+                left -= len(block)
+
+
+def serve(folder, port=DEFAULT_PORT, bind="", refresh=DEFAULT_REFRESH, installer=None):
+    installer = installer or Installer(data_dir=os.path.join(folder, ".setup"))
+    stop = threading.Event()
+
+    def refresh_loop():
+        while True:
+            try:
+                tag = sync_mirror(folder, installer)
+                print(f"Mirror holds {tag}.", file=sys.stderr)
+            except Exception as e:
+                # keep serving what is already there; seats fall back to GitHub for the rest
+                print(f"Mirror refresh failed: {e}", file=sys.stderr)
+            if stop.wait(refresh):
+                return
+
+    handler = type("Handler", (MirrorHandler,), {"folder": folder})
+    httpd = http.server.ThreadingHTTPServer((bind, port), handler)
+    httpd.daemon_threads = True
+    threading.Thread(target=refresh_loop, daemon=True).start()
+    print(f"Serving {folder} on port {httpd.server_port}.", file=sys.stderr)
+    try:
+        httpd.serve_forever()
+    finally:
+        stop.set()
+        httpd.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="setup", description=__doc__.splitlines()[0])
+    parser.add_argument("--serve-mirror", action="store_true", required=True,
+                        help="mirror the latest release and serve it to other seats")
+    parser.add_argument("--mirror-dir", default=os.path.join(SETUP_DATA_DIR, "mirror"),
+                        help="folder that holds the mirrored release")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--bind", default="", help="address to listen on (default: all)")
+    parser.add_argument("--refresh", type=int, default=DEFAULT_REFRESH,
+                        help="seconds between checks for a new release")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    os.makedirs(args.mirror_dir, exist_ok=True)
+    try:
+        serve(args.mirror_dir, args.port, args.bind, args.refresh)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+import http.server
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import zipfile
+
+from installer import RESOURCE_DIR, TAG_PREFIX, MANIFEST_ASSET, sha256_file
+
+
+# hex text deflates to a bit over half its size, and a block that repeats inside
+# deflate's 32 KiB window compresses further, like real support files
+TEXT_BLOCK = 16 * 1024
+# compressible members must come out at most this fraction of their size
+MAX_TEXT_RATIO = 0.7
+
+
+def write_random_member(archive, name, size, compressible=False):
+    block = os.urandom(TEXT_BLOCK // 2).hex().encode() if compressible else None
+    with archive.open(name, "w", force_zip64=size > 0x7FFFFFFF) as f:
+        left = size
+        while left > 0:
+            n = min(left, TEXT_BLOCK if compressible else 64 * 1024)
+            f.write(block[:n] if compressible else os.urandom(n))
+            left -= n
+
+
+def build_release(folder, version, size):
+    """Write a synthetic release of roughly size bytes into folder.
+
+    The resource zip gets an incompressible .dwg plus some compressible
+    files, the plugin zip a random StreetViewLocate.dll, like the real
+    assets. Returns {asset name: path}.
+    """
+    os.makedirs(folder, exist_ok=True)
+    resources = os.path.join(folder, RESOURCE_DIR + ".zip")
+    plugin = os.path.join(folder, f"{TAG_PREFIX}{version}.zip")
+
+    with zipfile.ZipFile(resources, "w", zipfile.ZIP_DEFLATED) as z:
+        write_random_member(z, f"{RESOURCE_DIR}/streetViewLocate_block.dwg", int(size * 0.5))
+        for i in range(8):
+            write_random_member(z, f"{RESOURCE_DIR}/support/file{i}.txt", int(size * 0.1 / 8), True)
+
+    with zipfile.ZipFile(plugin, "w", zipfile.ZIP_DEFLATED) as z:
+        write_random_member(z, f"{TAG_PREFIX}{version}/StreetViewLocate.dll", int(size * 0.4))
+        write_random_member(z, f"{TAG_PREFIX}{version}/StreetViewLocate.pdb", 64 * 1024, True)
+
+    for path in (resources, plugin):
+        with zipfile.ZipFile(path) as z:
+            for info in z.infolist():
+                if info.filename.endswith((".txt", ".pdb")) and info.file_size and \
+                        info.compress_size > info.file_size * MAX_TEXT_RATIO:
+                    raise ValueError(f"{info.filename} did not compress: "
+                                     f"{info.compress_size} of {info.file_size} bytes.")
+
+    return {os.path.basename(resources): resources, os.path.basename(plugin): plugin}
+
+
+def build_manifest(assets):
+    manifest = {"assets": {}, "archives": {}}
+    for name, path in assets.items():
+        manifest["assets"][name] = {"size": os.path.getsize(path), "sha256": sha256_file(path)}
+        entries = []
+        with zipfile.ZipFile(path) as z:
+            for info in z.infolist():
+                digest = hashlib.sha256()
+                with z.open(info) as f:
+                    for block in iter(lambda: f.read(1024 * 1024), b""):
+                        digest.update(block)
+                entries.append({"path": info.filename, "size": info.file_size,
+                                "sha256": digest.hexdigest()})
+        manifest["archives"][name] = entries
+    return manifest
+
+
+def installer_for(server, root, **kwargs):
+    """An Installer that installs under root from server, with fast retries."""
+    from installer import Installer, InstallPaths
+    kwargs.setdefault("downloads_url", server.url + "/releases")
+    return Installer(paths=InstallPaths.under(root), releases_url=server.url + "/releases",
+                     cuix_url=server.url + "/cuix", data_dir=os.path.join(root, "setup"), **kwargs)
+
+
+class MockReleaseServer:
+    """Local stand-in for the GitHub releases API and asset hosting.
+
+    Serves /releases/latest, /releases/tags/<tag>, /assets/<name> and
+    /cuix with Range and ETag support, and every asset under GitHub's direct
+    links too (/releases/latest/download/<name>, /releases/download/<tag>/<name>). Assets carry a GitHub style
+    "sha256:..." digest unless digests=False. bandwidth (bytes/s per response),
+    latency (seconds before each response) and error_rate (fraction of
+    asset responses cut off mid-body) shape the link.
+    """
+
+    def __init__(self, version, assets, cuix=b"", bandwidth=0, latency=0.0,
+                 error_rate=0.0, manifest=None, seed=0, digests=True):
+        self.version = version
+        self.assets = dict(assets)
+        self.digests = {name: sha256_file(path) for name, path in assets.items()} if digests else {}
+        self.cuix = cuix
+        self.bandwidth = bandwidth
+        self.latency = latency
+        self.error_rate = error_rate
+        self.manifest = manifest
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.errors_injected = 0
+        self.httpd = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.httpd.server_port}"
+
+    def release_json(self):
+        assets = []
+        for index, (name, path) in enumerate(sorted(self.assets.items()), 1):
+            asset = {"id": index, "name": name, "size": os.path.getsize(path),
+                     "browser_download_url": f"{self.url}/assets/{name}"}
+            if name in self.digests:
+                asset["digest"] = "sha256:" + self.digests[name]
+            assets.append(asset)
+        if self.manifest is not None:
+            assets.append({"id": len(assets) + 1, "name": MANIFEST_ASSET, "size": 0,
+                           "browser_download_url": f"{self.url}/manifest"})
+        return json.dumps({"tag_name": TAG_PREFIX + self.version, "assets": assets}).encode()
+
+    def start(self):
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with server.lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+
+                path = self.path.split("?")[0]
+                tag = re.escape(TAG_PREFIX + server.version)
+                direct = re.match(rf"/releases/(?:latest/download|download/{tag})/([^/]+)$", path)
+                if path in ("/releases/latest", f"/releases/tags/{TAG_PREFIX}{server.version}"):
+                    self.send_bytes(server.release_json())
+                elif path == "/manifest" and server.manifest is not None:
+                    self.send_bytes(json.dumps(server.manifest).encode())
+                elif path == "/cuix":
+                    self.send_bytes(server.cuix)
+                elif path.startswith("/assets/") and path[8:] in server.assets:
+                    self.send_file(server.assets[path[8:]])
+                elif direct and direct.group(1) in server.assets:
+                    self.send_file(server.assets[direct.group(1)])
+                else:
+                    self.send_error(404)
+
+            def send_bytes(self, body):
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with server.lock:
+                    server.bytes_sent += len(body)
+
+            def send_file(self, path):
+                size = os.path.getsize(path)
+                start, end = 0, size - 1
+                match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+                if match:
+                    start = int(match.group(1))
+                    end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+                    if start >= size:
+                        self.send_response(416)
+                        self.send_header("Content-Range", f"bytes */{size}")
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+                else:
+                    self.send_response(200)
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("Content-Length", str(end - start + 1))
+                self.end_headers()
+
+                with server.lock:
+                    fail = server.random.random() < server.error_rate
+                    cut = server.random.randint(start, end) if fail else end + 1
+                    if fail:
+                        server.errors_injected += 1
+
+                with open(path, "rb") as f:
+                    f.seek(start)
+                    position = start
+                    began = time.perf_counter()
+                    while position <= end:
+                        block = f.read(min(64 * 1024, end + 1 - position, max(cut - position, 1)))
+                        if position >= cut:
+                            self.close_connection = True
+                            self.connection.shutdown(2)
+                            return
+                        self.wfile.write(block)
+                        position += len(block)
+                        with server.lock:
+                            server.bytes_sent += len(block)
+                        if server.bandwidth:
+                            ahead = (position - start) / server.bandwidth - (time.perf_counter() - began)
+                            if ahead > 0:
+                                time.sleep(ahead)
+
+        class Server(http.server.ThreadingHTTPServer):
+            def handle_error(self, request, client_address):
+                # an installer that gives up on a transfer just hangs up
+                if not isinstance(sys.exc_info()[1], ConnectionError):
+                    super().handle_error(request, client_address)
+
+        self.httpd = Server(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,248 @@
+"""Build the release assets the installer downloads.
+
+    python package_release.py --version 1.2 [--plugin ..\\bin\\x64\\Release] [--output dist]
+    python package_release.py --version 1.2 --report
+
+Writes StreetViewBySumanKumarBHUTUU.zip (the block library and support
+files), StreetViewLocate_V<version>.zip (the plugin build output), the
+per-file manifest used for delta updates and a small index naming all of
+them, ready to upload to the GitHub release.
+
+The zips are laid out for the installer's streaming extractor: every local
+header carries the sizes and CRC (no data descriptors, no zip64), members
+come in path order with fixed timestamps so the same input always gives
+the same bytes, and each member is stored or deflated by its type, so
+already-compressed data such as .dwg is not inflated again on every seat.
+--report builds every compression setting and prints archive size against
+extraction time.
+"""
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+import zlib
+
+from installer import (StreamingZipExtractor, INDEX_ASSET, MANIFEST_ASSET, RESOURCE_DIR,
+                       TAG_PREFIX, sha256_file)
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PLUGIN_DIR = os.path.join(REPO, "bin", "x64", "Release")
+DEFAULT_EXCLUDE = ("*.pdb",)
+# DOS epoch: the earliest time a zip header can hold
+FIXED_DATE = (1980, 1, 1, 0, 0, 0)
+DEFAULT_LEVEL = 9
+# formats that are compressed already; deflating them again costs time and saves nothing
+STORED_EXTENSIONS = {".dwg", ".cuix", ".zip", ".7z", ".gz", ".png", ".jpg", ".jpeg", ".gif"}
+# anything else is probed: store it if deflate saves less than this on a sample
+# taken from its start, middle and end
+MIN_SAVING = 0.05
+PROBE_SIZE = 64 * 1024
+SETTINGS = ("stored", "deflate-1", "deflate-6", "deflate-9", "by-type")
+
+
+def collect_files(folder, exclude=()):
+    """Relative paths of the files (and empty folders, with a trailing /) under folder, in order."""
+    entries = []
+    for root, dirs, files in os.walk(folder):
+        dirs.sort()
+        relative = os.path.relpath(root, folder).replace(os.sep, "/")
+        prefix = "" if relative == "." else relative + "/"
+        names = [name for name in sorted(files)
+                 if not any(fnmatch.fnmatch(name.lower(), pattern) for pattern in exclude)]
+        if not names and not dirs and prefix:
+            entries.append(prefix)
+        entries.extend(prefix + name for name in names)
+    return entries
+
+
+def choose_compression(path, setting, level=DEFAULT_LEVEL):
+    """(compress_type, level) for one file under a compression setting."""
+    if setting == "stored":
+        return zipfile.ZIP_STORED, None
+    if setting.startswith("deflate-"):
+        return zipfile.ZIP_DEFLATED, int(setting[len("deflate-"):])
+    if os.path.splitext(path)[1].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED, None
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        if size <= 3 * PROBE_SIZE:
+            sample = f.read()
+        else:
+            sample = b""
+            for offset in (0, size // 2, size - PROBE_SIZE):
+                f.seek(offset)
+                sample += f.read(PROBE_SIZE)
+    if sample and len(zlib.compress(sample, level)) > len(sample) * (1 - MIN_SAVING):
+        return zipfile.ZIP_STORED, None
+    return zipfile.ZIP_DEFLATED, level
+
+
+def build_archive(path, folder, prefix, setting="by-type", level=DEFAULT_LEVEL, exclude=()):
+    """Zip folder into path with every member under prefix/; returns the manifest entries."""
+    entries = []
+    with zipfile.ZipFile(path, "w") as z:
+        for relative in collect_files(folder, exclude):
+            name = f"{prefix}/{relative}"
+            info = zipfile.ZipInfo(name, date_time=FIXED_DATE)
+            info.create_system = 3
+            if relative.endswith("/"):
+                info.external_attr = (0o40755 << 16) | 0x10
+                z.writestr(info, b"")
+                entries.append({"path": name, "size": 0, "sha256": hashlib.sha256().hexdigest()})
+                continue
+
+            source = os.path.join(folder, *relative.split("/"))
+            info.external_attr = 0o100644 << 16
+            info.file_size = os.path.getsize(source)
+            if info.file_size > zipfile.ZIP64_LIMIT:
+                raise ValueError(f"{relative} is too large to stream (over 2 GiB).")
+            info.compress_type, info._compresslevel = choose_compression(source, setting, level)
+            digest = hashlib.sha256()
+            # seekable output, so zipfile rewrites the local header with the real sizes
+            # instead of appending a data descriptor
+            with open(source, "rb") as src, z.open(info, "w") as dst:
+                for block in iter(lambda: src.read(shutil.COPY_BUFSIZE), b""):
+                    digest.update(block)
+                    dst.write(block)
+            entries.append({"path": name, "size": info.file_size, "sha256": digest.hexdigest()})
+    return entries
+
+
+def build_release(output, version, resources_dir, plugin_dir, setting="by-type",
+                  level=DEFAULT_LEVEL, exclude=DEFAULT_EXCLUDE):
+    """Write both zips, the manifest and the index into output; returns {asset name: path}."""
+    os.makedirs(output, exist_ok=True)
+    tag = TAG_PREFIX + version
+    resources = RESOURCE_DIR + ".zip"
+    plugin = tag + ".zip"
+    assets = {}
+    manifest = {"assets": {}, "archives": {}}
+
+    for name, folder, prefix, skip in ((resources, resources_dir, RESOURCE_DIR, ()),
+                                       (plugin, plugin_dir, tag, exclude)):
+        if not os.path.isdir(folder):
+            raise SystemExit(f"{folder} does not exist.")
+        path = os.path.join(output, name)
+        manifest["archives"][name] = build_archive(path, folder, prefix, setting, level, skip)
+        manifest["assets"][name] = {"size": os.path.getsize(path), "sha256": sha256_file(path)}
+        assets[name] = path
+
+    assets[MANIFEST_ASSET] = write_json(os.path.join(output, MANIFEST_ASSET), manifest)
+    index = {
+        "tag_name": tag,
+        "resources": resources,
+        "plugin": plugin,
+        "manifest": MANIFEST_ASSET,
+        "assets": [{"name": name, "size": os.path.getsize(path), "digest": "sha256:" + sha256_file(path)}
+                   for name, path in sorted(assets.items())],
+    }
+    assets[INDEX_ASSET] = write_json(os.path.join(output, INDEX_ASSET), index)
+    return assets
+
+
+def write_json(path, data):
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+        f.write("\n")
+    return path
+
+
+# =========================================================
+# REPORT
+# =========================================================
+
+def time_extraction(path, runs=3):
+    """Best-of-runs seconds to extract path with zipfile and with the streaming extractor."""
+    extract = stream = float("inf")
+    for _ in range(runs):
+        dest = tempfile.mkdtemp(prefix="svl-extract-")
+        try:
+            started = time.perf_counter()
+            with zipfile.ZipFile(path) as z:
+                z.extractall(dest)
+            extract = min(extract, time.perf_counter() - started)
+        finally:
+            shutil.rmtree(dest, ignore_errors=True)
+
+        dest = tempfile.mkdtemp(prefix="svl-extract-")
+        try:
+            started = time.perf_counter()
+            extractor = StreamingZipExtractor(dest)
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    extractor.feed(block)
+            if extractor.failed or not extractor.complete:
+                stream = None
+            elif stream is not None:
+                stream = min(stream, time.perf_counter() - started)
+        finally:
+            shutil.rmtree(dest, ignore_errors=True)
+    return extract, stream
+
+
+def report(version, resources_dir, plugin_dir, level, exclude):
+    """Build the release under every setting and print size against extraction time."""
+    work = tempfile.mkdtemp(prefix="svl-package-")
+    results = []
+    try:
+        for setting in SETTINGS:
+            assets = build_release(os.path.join(work, setting), version, resources_dir, plugin_dir,
+                                   setting, level, exclude)
+            for name in (RESOURCE_DIR + ".zip", f"{TAG_PREFIX}{version}.zip"):
+                with zipfile.ZipFile(assets[name]) as z:
+                    raw = sum(info.file_size for info in z.infolist())
+                extract, stream = time_extraction(assets[name])
+                results.append({"archive": name, "setting": setting, "size": os.path.getsize(assets[name]),
+                                "raw": raw, "extract_s": extract, "stream_s": stream})
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+    mb = 1024 ** 2
+    print(f"{'archive':<40} {'setting':<10} {'size MB':>9} {'of raw':>7} {'extract s':>10} {'stream s':>9}")
+    for r in results:
+        stream = f"{r['stream_s']:>9.3f}" if r["stream_s"] is not None else f"{'n/a':>9}"
+        print(f"{r['archive']:<40} {r['setting']:<10} {r['size'] / mb:>9.2f} "
+              f"{r['size'] / max(r['raw'], 1):>7.1%} {r['extract_s']:>10.3f} {stream}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--version", required=True, help="release version, e.g. 1.2")
+    parser.add_argument("--resources", default=os.path.join(REPO, RESOURCE_DIR),
+                        help="folder with the block library and support files")
+    parser.add_argument("--plugin", default=DEFAULT_PLUGIN_DIR,
+                        help="plugin build output (StreetViewLocate.dll and its dependencies)")
+    parser.add_argument("--output", default=os.path.join(REPO, "dist"), help="folder to write the assets to")
+    parser.add_argument("--setting", choices=SETTINGS, default="by-type",
+                        help="compression: by file type (default), or one method for every member")
+    parser.add_argument("--level", type=int, choices=range(1, 10), default=DEFAULT_LEVEL,
+                        metavar="1-9", help="deflate level for by-type")
+    parser.add_argument("--exclude", action="append",
+                        help=f"file name pattern to leave out of the plugin zip "
+                             f"(default: {', '.join(DEFAULT_EXCLUDE)})")
+    parser.add_argument("--report", action="store_true",
+                        help="compare archive size and extraction time for every setting")
+    args = parser.parse_args(argv)
+    exclude = tuple(p.lower() for p in args.exclude) if args.exclude is not None else DEFAULT_EXCLUDE
+
+    if args.report:
+        report(args.version, args.resources, args.plugin, args.level, exclude)
+        return 0
+
+    assets = build_release(args.output, args.version, args.resources, args.plugin,
+                           args.setting, args.level, exclude)
+    for name, path in assets.items():
+        print(f"{os.path.getsize(path):>12,}  {name}")
+    print(f"Upload these to the {TAG_PREFIX}{args.version} release.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+"""Turn CAD point exports into Google Street View links in bulk.
+
+    python streetview_links.py points.csv --cs UTM84-43N > links.csv
+    python streetview_links.py chainage.dxf --cs BRITISHNATGRID --output links.csv
+
+Coordinate system codes are mapped to EPSG through the same
+ACAD_CS_TO_EPSG table as the STREETVIEWLOCATE command (the installed
+streetViewLocate_configuration.json, else the plugin's defaults). Rows are
+read, transformed and written in fixed-size chunks with one pyproj
+transformer per EPSG code, so memory stays flat however large the input is.
+
+Needs numpy and pyproj (pip install numpy pyproj).
+"""
+import argparse
+import csv
+import functools
+import json
+import os
+import sys
+
+try:
+    import numpy as np
+    from pyproj import Transformer
+except ImportError as e:
+    np = Transformer = None
+    MISSING = e.name
+
+DEFAULT_CS_TO_EPSG = {
+    "UTM84-40N": "32640",
+    "UTM84-41N": "32641",
+    "UTM84-42N": "32642",
+    "UTM84-43N": "32643",
+    "UTM84-44N": "32644",
+    "UTM84-45N": "32645",
+    "WGS84": "4326",
+    "BRITISHNATGRID": "27700",
+    "OSGB1936.NATIONALGRID": "27700",
+    "WEBMERCATOR": "3857",
+}
+CHUNK_ROWS = 64 * 1024
+NO_LINK = ["", "", ""]
+X_COLUMNS = ("x", "easting", "east", "e")
+Y_COLUMNS = ("y", "northing", "north", "n")
+# the view the plugin opens: 75 degree field of view, level camera
+URL = "https://www.google.com/maps/@{},{},3a,75y,{}h,90t/data=!3m1!1e1"
+
+
+def default_config_path():
+    # where setup installs the plugin (InstallPaths.default().bundle); not imported
+    # from installer, which would pull in requests just to build a path
+    return os.path.join(os.environ.get("PROGRAMDATA", "C:\\ProgramData"), "Autodesk",
+                        "ApplicationPlugins", "StreetViewLocate.bundle", "streetViewLocate_configuration.json")
+
+
+def load_cs_to_epsg(path=None):
+    """ACAD_CS_TO_EPSG from the configuration file, keys upper-cased like the plugin does."""
+    path = path or default_config_path()
+    if not os.path.exists(path):
+        return dict(DEFAULT_CS_TO_EPSG)
+    with open(path, "r", encoding="utf-8-sig") as f:
+        mapping = json.load(f).get("ACAD_CS_TO_EPSG") or DEFAULT_CS_TO_EPSG
+    return {key.upper(): str(value) for key, value in mapping.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def transformer(epsg):
+    return Transformer.from_crs(f"EPSG:{epsg}", "EPSG:4326", always_xy=True)
+
+
+def to_floats(values):
+    try:
+        return np.asarray(values, dtype=np.float64)
+    except ValueError:
+        out = np.full(len(values), np.nan)
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except (TypeError, ValueError):
+                pass
+        return out
+
+
+def to_wgs84(x, y, epsg):
+    """(lat, lon) arrays for x/y arrays; epsg is one code or an array with one code per point."""
+    lat = np.full(len(x), np.nan)
+    lon = np.full(len(x), np.nan)
+    codes = np.asarray(epsg)
+    for code in (np.unique(codes) if codes.ndim else [codes]):
+        mask = codes == code if codes.ndim else slice(None)
+        if not code:
+            continue
+        lon[mask], lat[mask] = transformer(int(code)).transform(x[mask], y[mask])
+    return lat, lon
+
+
+def link_columns(lat, lon, heading):
+    """[lat, lon, url] text for each point; empty for NaN (bad input) or inf (outside the projection)."""
+    valid = ((np.abs(lat) <= 90) & (np.abs(lon) <= 180)).tolist()
+    columns = []
+    for ok, a, o in zip(valid, lat.tolist(), lon.tolist()):
+        if ok:
+            a, o = f"{a:.7f}", f"{o:.7f}"
+            columns.append([a, o, URL.format(a, o, heading)])
+        else:
+            columns.append(NO_LINK)
+    return columns
+
+
+# =========================================================
+# INPUT
+# =========================================================
+
+def column_index(header, wanted, candidates, what):
+    names = [h.strip().lower() for h in header]
+    if wanted is not None:
+        if wanted.isdigit():
+            return int(wanted) - 1
+        if wanted.lower() in names:
+            return names.index(wanted.lower())
+        raise SystemExit(f"No {what} column named {wanted!r}.")
+    for name in candidates:
+        if name in names:
+            return names.index(name)
+    raise SystemExit(f"Cannot tell which column holds {what}; pass --{what}-column.")
+
+
+def csv_chunks(f, args):
+    """Yield (header, rows, x index, y index, cs index) for each chunk of a CSV file."""
+    reader = csv.reader(f, delimiter=args.delimiter)
+    first = next(reader, None)
+    if first is None:
+        return
+    rows = []
+    if args.no_header:
+        header = [f"column{i + 1}" for i in range(len(first))]
+        rows.append(first)
+    else:
+        header = first
+    xi = column_index(header, args.x_column or ("1" if args.no_header else None), X_COLUMNS, "x")
+    yi = column_index(header, args.y_column or ("2" if args.no_header else None), Y_COLUMNS, "y")
+    ci = column_index(header, args.cs_column, (), "cs") if args.cs_column else None
+
+    for row in reader:
+        rows.append(row)
+        if len(rows) >= args.chunk_rows:
+            yield header, rows, xi, yi, ci
+            rows = []
+    if rows:
+        yield header, rows, xi, yi, ci
+
+
+DXF_ENTITIES = {"POINT", "INSERT", "TEXT", "MTEXT"}
+
+
+def dxf_points(f):
+    """Yield (type, layer, handle, x, y) for POINT/INSERT/TEXT/MTEXT entities of a DXF file."""
+    section = None
+    entity = None
+    pending = None
+    while True:
+        code = f.readline()
+        value = f.readline()
+        if not value:
+            break
+        code, value = code.strip(), value.strip()
+        if code == "0":
+            if entity and entity.get("x") is not None and entity.get("y") is not None:
+                yield entity["type"], entity.get("layer", ""), entity.get("handle", ""), entity["x"], entity["y"]
+            entity = None
+            if value == "SECTION":
+                pending = "name"
+            elif value == "ENDSEC":
+                section = None
+            elif section == "ENTITIES" and value in DXF_ENTITIES:
+                entity = {"type": value}
+        elif code == "2" and pending == "name":
+            section, pending = value, None
+        elif entity is not None:
+            if code == "8":
+                entity["layer"] = value
+            elif code == "5":
+                entity["handle"] = value
+            elif code == "10":
+                entity["x"] = value
+            elif code == "20":
+                entity["y"] = value
+
+
+def dxf_chunks(f, args):
+    header = ["type", "layer", "handle", "x", "y"]
+    rows = []
+    for point in dxf_points(f):
+        rows.append(list(point))
+        if len(rows) >= args.chunk_rows:
+            yield header, rows, 3, 4, None
+            rows = []
+    if rows:
+        yield header, rows, 3, 4, None
+
+
+# =========================================================
+# MAIN
+# =========================================================
+
+def convert(chunks, out, cs_to_epsg, default_epsg, heading):
+    """Write every chunk with lat, lon and url columns added; returns (rows, rows without a link)."""
+    writer = csv.writer(out, lineterminator="\n")
+    total = failed = 0
+    for header, rows, xi, yi, ci in chunks:
+        if total == 0:
+            writer.writerow(header + ["lat", "lon", "url"])
+        x = to_floats([row[xi] if len(row) > xi else "" for row in rows])
+        y = to_floats([row[yi] if len(row) > yi else "" for row in rows])
+        if ci is None:
+            epsg = default_epsg
+        else:
+            # look up each distinct code once; empty cells fall back to --cs/--epsg,
+            # unknown codes get no link
+            names, inverse = np.unique([row[ci] if len(row) > ci else "" for row in rows],
+                                       return_inverse=True)
+            fallback = str(default_epsg or "")
+            epsg = np.array([cs_to_epsg.get(name.strip().upper(), "") if name.strip() else fallback
+                             for name in names.tolist()])[inverse]
+        columns = link_columns(*to_wgs84(x, y, epsg), heading)
+        writer.writerows(row + extra for row, extra in zip(rows, columns))
+        total += len(rows)
+        failed += columns.count(NO_LINK)
+    return total, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="CSV or DXF file, or - for CSV on stdin")
+    parser.add_argument("--cs", help="AutoCAD coordinate system of the points, e.g. UTM84-43N")
+    parser.add_argument("--epsg", type=int, help="EPSG code of the points, instead of --cs")
+    parser.add_argument("--cs-column", help="CSV column holding a coordinate system code per row")
+    parser.add_argument("--config", help="streetViewLocate_configuration.json to read ACAD_CS_TO_EPSG from "
+                                         "(default: the installed plugin's)")
+    parser.add_argument("--x-column", help="name or 1-based number of the easting column")
+    parser.add_argument("--y-column", help="name or 1-based number of the northing column")
+    parser.add_argument("--no-header", action="store_true", help="the CSV has no header row")
+    parser.add_argument("--delimiter", default=",")
+    parser.add_argument("--heading", type=float, default=45, help="camera heading in degrees")
+    parser.add_argument("--output", help="CSV to write (default: stdout)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if np is None:
+        raise SystemExit(f"{MISSING} is required: pip install numpy pyproj")
+
+    cs_to_epsg = load_cs_to_epsg(args.config)
+    default_epsg = args.epsg
+    if default_epsg is None and args.cs:
+        code = cs_to_epsg.get(args.cs.upper())
+        if code is None:
+            raise SystemExit(f"Coordinate system {args.cs!r} is not in ACAD_CS_TO_EPSG; "
+                             "add it to the configuration file or pass --epsg.")
+        default_epsg = int(code)
+    if default_epsg is None and not args.cs_column:
+        raise SystemExit("Pass --cs, --epsg or --cs-column.")
+    heading = f"{args.heading:g}"
+
+    is_dxf = args.input.lower().endswith(".dxf")
+    if args.input == "-":
+        source = sys.stdin
+    else:
+        source = open(args.input, "r", encoding="utf-8-sig", errors="replace",
+                      newline=None if is_dxf else "")
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    try:
+        chunks = dxf_chunks(source, args) if is_dxf else csv_chunks(source, args)
+        total, failed = convert(chunks, out, cs_to_epsg, default_epsg, heading)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+    print(f"{total} points, {failed} without a link.", file=sys.stderr)
+    return 0 if total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
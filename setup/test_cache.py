@@ -0,0 +1,93 @@
+"""Checks for the download cache: reuse across installs and least-recently-used eviction.
+
+    python -m unittest discover -s setup
+"""
+import hashlib
+import os
+import tempfile
+import unittest
+
+from installer import DownloadCache, Installer, InstallPaths, _release_info
+from mock_release_server import MockReleaseServer, build_manifest, build_release
+
+
+class DownloadCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = os.path.join(self.tmp.name, "cache")
+
+    def blob(self, data):
+        fd, path = tempfile.mkstemp(dir=self.tmp.name)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        return path
+
+    def age(self, cache):
+        # pretend every entry was last used by an earlier run, oldest first
+        for used, entry in enumerate(cache.entries.values(), 1):
+            entry["used"] = used
+        cache.save()
+
+    def test_evicts_least_recently_used(self):
+        earlier = DownloadCache(self.root, 250)
+        for key in "abc":
+            earlier.store(key, self.blob(key.encode() * 100))
+        self.age(earlier)
+
+        cache = DownloadCache(self.root, 250)
+        self.assertIsNotNone(cache.lookup("a"))
+        cache.store("d", self.blob(b"d" * 100))
+        self.assertIsNone(cache.lookup("b"))
+        self.assertIsNone(cache.lookup("c"))
+        self.assertIsNotNone(cache.lookup("a"))
+        self.assertIsNotNone(cache.lookup("d"))
+        self.assertFalse(os.path.exists(cache.blob_path(hashlib.sha256(b"b" * 100).hexdigest())))
+
+    def test_keeps_entries_used_by_this_run(self):
+        cache = DownloadCache(self.root, 150)
+        for key in "ab":
+            cache.store(key, self.blob(key.encode() * 100))
+        # over the limit, but both may still be extracted by this install
+        self.assertIsNotNone(cache.lookup("a"))
+        self.assertIsNotNone(cache.lookup("b"))
+
+    def test_shared_blob_stays_while_referenced(self):
+        earlier = DownloadCache(self.root, 250)
+        earlier.store("a", self.blob(b"x" * 100))
+        earlier.store("c", self.blob(b"c" * 100))
+        earlier.store("b", self.blob(b"x" * 100))
+        self.age(earlier)
+
+        cache = DownloadCache(self.root, 250)
+        cache.store("d", self.blob(b"d" * 100))
+        # dropping a frees nothing while b shares its blob, so c goes too
+        self.assertIsNone(cache.lookup("a"))
+        self.assertIsNone(cache.lookup("c"))
+        self.assertIsNotNone(cache.lookup("b"))
+        self.assertIsNotNone(cache.lookup("d"))
+
+
+class InstallFromCacheTest(unittest.TestCase):
+
+    def test_second_seat_reuses_cached_assets(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            assets = build_release(os.path.join(tmp, "1.0"), "1.0", 256 * 1024)
+            server = MockReleaseServer("1.0", assets, cuix=b"cuix", manifest=build_manifest(assets)).start()
+            self.addCleanup(server.stop)
+            downloads = []
+            for seat in ("one", "two"):
+                _release_info.clear()
+                engine = Installer(paths=InstallPaths.under(os.path.join(tmp, seat)),
+                                   releases_url=server.url + "/releases", cuix_url=server.url + "/cuix",
+                                   downloads_url=server.url + "/releases", data_dir=os.path.join(tmp, "setup"))
+                self.assertTrue(engine.run())
+                downloads += [p for p in engine.metrics.summary()["phases"] if p["phase"] == "download"]
+            self.assertGreater(downloads[0]["bytes"], 0)
+            self.assertEqual(downloads[1]["bytes"], 0)
+            self.assertEqual(downloads[1]["cache_hits"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Checks the silent install's exit codes and its final JSON line.
+
+    python -m unittest discover -s setup
+"""
+import io
+import json
+import os
+import socket
+import tempfile
+import unittest
+from unittest import mock
+
+import cli
+import installer
+from installer import Installer, InstallPaths, _release_info
+from mock_release_server import MockReleaseServer, build_release
+
+
+class SilentInstallTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.object(installer, "RETRY_BACKOFF", 0.001)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.assets = build_release(os.path.join(self.tmp.name, "1.0"), "1.0", 256 * 1024)
+        self.server = MockReleaseServer("1.0", self.assets, cuix=b"cuix").start()
+        self.addCleanup(self.server.stop)
+        self.url = self.server.url
+
+    def run_cli(self, *argv):
+        """(exit code, last JSON line) of a silent install against the mock server."""
+        def local_installer(*args, **kwargs):
+            return Installer(*args, paths=InstallPaths.under(os.path.join(self.tmp.name, "root")),
+                             releases_url=self.url + "/releases", cuix_url=self.url + "/cuix",
+                             downloads_url=self.url + "/releases", **kwargs)
+
+        _release_info.clear()
+        stream = io.StringIO()
+        args = cli.parse_args(["--silent", "--cache-dir", os.path.join(self.tmp.name, "cache"),
+                               "--mirror", "", *argv])
+        with mock.patch.object(cli, "Installer", local_installer):
+            code = cli.run(args, cli.JsonReporter(stream))
+        result = json.loads(stream.getvalue().splitlines()[-1])
+        self.assertEqual(result["event"], "result")
+        self.assertEqual(result["exit_code"], code)
+        return code, result
+
+    def test_eula_must_be_accepted(self):
+        code, result = self.run_cli()
+        self.assertEqual(code, cli.EXIT_EULA_NOT_ACCEPTED)
+        self.assertEqual(result["status"], "eula-not-accepted")
+
+    def test_installs_then_reports_up_to_date(self):
+        code, result = self.run_cli("--accept-eula")
+        self.assertEqual((code, result["status"], result["version"]), (cli.EXIT_OK, "installed", "1.0"))
+        code, result = self.run_cli("--accept-eula")
+        self.assertEqual((code, result["status"]), (cli.EXIT_OK, "up-to-date"))
+        code, result = self.run_cli("--accept-eula", "--force")
+        self.assertEqual((code, result["status"]), (cli.EXIT_OK, "installed"))
+
+    def test_network_error(self):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            # nothing listens on a port that was bound but never listened on
+            self.url = f"http://127.0.0.1:{s.getsockname()[1]}"
+            code, result = self.run_cli("--accept-eula")
+        self.assertEqual((code, result["status"]), (cli.EXIT_NETWORK, "network-error"))
+
+    def test_corrupt_release_fails(self):
+        plugin = next(name for name in self.assets if name.startswith(installer.TAG_PREFIX))
+        with open(self.assets[plugin], "r+b") as f:
+            f.seek(1000)
+            f.write(b"\0" * 64)
+        code, result = self.run_cli("--accept-eula")
+        self.assertEqual((code, result["status"]), (cli.EXIT_FAILED, "failed"))
+        self.assertIn("corrupt", result["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
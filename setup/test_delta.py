@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import requests
+
+import installer
+from installer import HttpRangeFile, _release_info
+from mock_release_server import MockReleaseServer, build_manifest, build_release, installer_for
+
+
+class DeltaUpdateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp.name, "root")
+        patcher = mock.patch.object(installer, "RETRY_BACKOFF", 0.001)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.install("1.0")
+
+    def install(self, version, **server_options):
+        assets = build_release(os.path.join(self.tmp.name, version), version, 512 * 1024)
+        server = MockReleaseServer(version, assets, cuix=b"cuix", manifest=build_manifest(assets),
+                                   **server_options).start()
+        self.addCleanup(server.stop)
+        _release_info.clear()
+        engine = installer_for(server, self.root)
+        self.assertTrue(engine.run())
+        return [record["phase"] for record in engine.metrics.summary()["phases"]], server
+
+    def test_upgrade_survives_dropped_connections(self):
+        phases, server = self.install("1.1", error_rate=0.3, seed=2)
+        self.assertGreater(server.errors_injected, 0)
+        self.assertIn("delta", phases)
+        self.assertNotIn("download", phases)
+
+    def test_upgrade_falls_back_to_full_install(self):
+        with mock.patch.object(HttpRangeFile, "read_range", side_effect=requests.ConnectionError("down")):
+            phases, _ = self.install("1.1")
+        self.assertIn("delta", phases)
+        self.assertIn("download", phases)
+
+
+if __name__ == "__main__":
+    unittest.main()
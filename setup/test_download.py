@@ -0,0 +1,84 @@
+"""Checks that interrupted downloads resume where they stopped and stale ones are cleaned up.
+
+    python -m unittest discover -s setup
+"""
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import installer
+from installer import asset_sha256, _release_info
+from mock_release_server import MockReleaseServer, build_manifest, build_release, installer_for
+
+
+class ResumeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.object(installer, "RETRY_BACKOFF", 0.001)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.assets = build_release(os.path.join(self.tmp.name, "1.0"), "1.0", 512 * 1024)
+        self.server = MockReleaseServer("1.0", self.assets, cuix=b"cuix",
+                                        manifest=build_manifest(self.assets)).start()
+        self.addCleanup(self.server.stop)
+        _release_info.clear()
+        self.engine = installer_for(self.server, os.path.join(self.tmp.name, "root"))
+        self.engine.connect()
+        os.makedirs(self.engine.download_dir, exist_ok=True)
+        self.zips = [asset for asset in self.engine.release_info()["assets"] if asset["name"].endswith(".zip")]
+
+    def part_path(self, asset):
+        return self.engine.part_path(asset["browser_download_url"], asset["size"], asset_sha256(asset))
+
+    def read(self, asset, end):
+        with open(self.assets[asset["name"]], "rb") as f:
+            return f.read(end)
+
+    def install(self):
+        self.assertTrue(self.engine.run())
+        download = [p for p in self.engine.metrics.summary()["phases"] if p["phase"] == "download"]
+        self.assertEqual(len(download), 1)
+        self.assertEqual(os.listdir(self.engine.download_dir), [])
+        return download[0]["bytes"]
+
+    def test_resumes_partial_with_range(self):
+        total = sum(asset["size"] for asset in self.zips)
+        for asset in self.zips:
+            with open(self.part_path(asset), "wb") as f:
+                f.write(self.read(asset, 100 * 1024))
+        self.assertEqual(self.install(), total - 2 * 100 * 1024)
+
+    def test_resumes_segments_from_state_file(self):
+        total = sum(asset["size"] for asset in self.zips)
+        for asset in self.zips:
+            size, half = asset["size"], asset["size"] // 2
+            part_path = self.part_path(asset)
+            with open(part_path, "wb") as f:
+                f.write(self.read(asset, half))
+                f.truncate(size)
+            with open(part_path + ".json", "w", encoding="utf-8") as f:
+                json.dump({"size": size, "segments": [[0, size, half]]}, f)
+        with mock.patch.object(installer, "SEGMENT_THRESHOLD", 64 * 1024):
+            self.assertEqual(self.install(), total - sum(a["size"] // 2 for a in self.zips))
+
+    def test_prunes_partials_of_other_downloads(self):
+        stale = [os.path.join(self.engine.download_dir, "0123456789abcdef-StreetViewLocate_V0.9.zip.part"),
+                 os.path.join(self.engine.download_dir, "fedcba9876543210-old.zip.part.json")]
+        for path in stale:
+            with open(path, "wb") as f:
+                f.write(b"stale")
+        kept = self.part_path(self.zips[0])
+        with open(kept, "wb") as f:
+            f.write(self.read(self.zips[0], 100 * 1024))
+        # the matching partial is still resumed
+        self.assertEqual(self.install(), sum(asset["size"] for asset in self.zips) - 100 * 1024)
+        for path in stale:
+            self.assertFalse(os.path.exists(path), path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+"""Regression checks for the parts of the installer that parse or rewrite bytes by hand.
+
+    python -m unittest discover -s setup
+"""
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+
+from installer import StreamingZipExtractor
+from mock_release_server import build_release
+
+
+class Unseekable(io.RawIOBase):
+    """Write-only stream, so zipfile has to put sizes and CRC in data descriptors."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+
+def make_zip(members, compression, seekable=True, force_zip64=False):
+    out = io.BytesIO() if seekable else Unseekable()
+    with zipfile.ZipFile(out, "w", compression) as z:
+        for name, data in members.items():
+            with z.open(name, "w", force_zip64=force_zip64) as f:
+                f.write(data)
+    return bytes(out.getvalue() if seekable else out.data)
+
+
+def stream(data, dest, chunk=777):
+    # an odd chunk size splits headers, data and descriptors across feeds
+    extractor = StreamingZipExtractor(dest)
+    for i in range(0, len(data), chunk):
+        extractor.feed(data[i:i + chunk])
+    return extractor
+
+
+MEMBERS = {
+    "bundle/a.txt": b"street view " * 5000,
+    "bundle/sub/b.bin": os.urandom(20000),
+    "bundle/empty.txt": b"",
+}
+
+
+class StreamingZipExtractorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dest = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assertExtracted(self, members):
+        for name, data in members.items():
+            with open(os.path.join(self.dest, *name.split("/")), "rb") as f:
+                self.assertEqual(f.read(), data, name)
+
+    def test_stored_members(self):
+        extractor = stream(make_zip(MEMBERS, zipfile.ZIP_STORED), self.dest)
+        self.assertTrue(extractor.complete)
+        self.assertFalse(extractor.failed)
+        self.assertExtracted(MEMBERS)
+
+    def test_deflated_members_with_data_descriptors(self):
+        data = make_zip(MEMBERS, zipfile.ZIP_DEFLATED, seekable=False)
+        with zipfile.ZipFile(io.BytesIO(data)) as z:
+            self.assertTrue(all(info.flag_bits & 0x08 for info in z.infolist()))
+        extractor = stream(data, self.dest)
+        self.assertTrue(extractor.complete)
+        self.assertFalse(extractor.failed)
+        self.assertExtracted(MEMBERS)
+
+    def test_stored_member_with_data_descriptor_needs_the_central_directory(self):
+        extractor = stream(make_zip(MEMBERS, zipfile.ZIP_STORED, seekable=False), self.dest)
+        self.assertTrue(extractor.failed)
+        self.assertFalse(extractor.complete)
+
+    def test_zip64_member_needs_the_central_directory(self):
+        extractor = stream(make_zip(MEMBERS, zipfile.ZIP_DEFLATED, force_zip64=True), self.dest)
+        self.assertTrue(extractor.failed)
+        self.assertFalse(extractor.complete)
+
+    def test_corrupt_member_aborts_and_ignores_the_rest(self):
+        data = bytearray(make_zip(MEMBERS, zipfile.ZIP_STORED))
+        # flip a byte inside the first member's data: its CRC no longer matches
+        data[100] ^= 0xFF
+        extractor = stream(bytes(data), self.dest)
+        self.assertTrue(extractor.failed)
+        self.assertFalse(extractor.complete)
+        self.assertIsNone(extractor.member)
+        self.assertEqual(extractor.fed, len(data))
+        self.assertEqual(len(extractor.buffer), 0)
+        # nothing after the bad member was written
+        self.assertFalse(os.path.exists(os.path.join(self.dest, "bundle", "sub")))
+
+    def test_release_archives(self):
+        with tempfile.TemporaryDirectory() as folder:
+            for name, path in build_release(folder, "0.0.1", 256 * 1024).items():
+                dest = os.path.join(self.dest, name)
+                with open(path, "rb") as f:
+                    extractor = stream(f.read(), dest, chunk=64 * 1024 + 3)
+                self.assertTrue(extractor.complete, name)
+                with zipfile.ZipFile(path) as z:
+                    for info in z.infolist():
+                        with open(os.path.join(dest, *info.filename.split("/")), "rb") as f:
+                            self.assertEqual(f.read(), z.read(info), info.filename)
+
+
+if __name__ == "__main__":
+    unittest.main()
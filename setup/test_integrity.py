@@ -0,0 +1,64 @@
+"""Checks that downloads are verified against the published size and SHA-256.
+
+    python -m unittest discover -s setup
+"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import installer
+from installer import IntegrityError, asset_sha256, _release_info
+from mock_release_server import MockReleaseServer, build_release, installer_for
+
+
+class IntegrityTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.object(installer, "RETRY_BACKOFF", 0.001)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.assets = build_release(os.path.join(self.tmp.name, "1.0"), "1.0", 256 * 1024)
+        self.server = MockReleaseServer("1.0", self.assets, cuix=b"cuix").start()
+        self.addCleanup(self.server.stop)
+        _release_info.clear()
+        self.engine = installer_for(self.server, os.path.join(self.tmp.name, "root"))
+        self.errors = []
+        self.engine.subscribe(type("Catcher", (installer.InstallObserver,),
+                                   {"on_failed": lambda _, e: self.errors.append(e)})())
+
+    def corrupt(self, name, offset=1000):
+        # same size, different bytes: only the digest can tell
+        with open(self.assets[name], "r+b") as f:
+            f.seek(offset)
+            data = f.read(64)
+            f.seek(offset)
+            f.write(bytes(b ^ 0xFF for b in data))
+
+    def test_digest_mismatch_fails_before_anything_is_replaced(self):
+        plugin = next(name for name in self.assets if name.startswith(installer.TAG_PREFIX))
+        self.corrupt(plugin)
+        self.assertFalse(self.engine.run())
+        self.assertIsInstance(self.errors[0], IntegrityError)
+        self.assertFalse(os.path.exists(self.engine.paths.win64))
+        self.assertFalse(os.path.exists(self.engine.paths.bundle))
+
+    def test_resumed_partial_with_wrong_bytes_restarts_once(self):
+        self.engine.connect()
+        os.makedirs(self.engine.download_dir, exist_ok=True)
+        zips = [asset for asset in self.engine.release_info()["assets"] if asset["name"].endswith(".zip")]
+        for asset in zips:
+            part_path = self.engine.part_path(asset["browser_download_url"], asset["size"], asset_sha256(asset))
+            with open(part_path, "wb") as f:
+                f.write(b"\0" * (asset["size"] // 2))
+        self.assertTrue(self.engine.run(), self.errors)
+        download = next(p for p in self.engine.metrics.summary()["phases"] if p["phase"] == "download")
+        # the second half once from the resumed partial, then the whole file
+        self.assertEqual(download["bytes"], sum(a["size"] - a["size"] // 2 + a["size"] for a in zips))
+        self.assertTrue(os.listdir(self.engine.paths.win64))
+
+
+if __name__ == "__main__":
+    unittest.main()
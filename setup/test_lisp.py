@@ -0,0 +1,72 @@
+"""Checks for the acad.lsp block the installer adds, replaces and migrates.
+
+    python -m unittest discover -s setup
+"""
+import os
+import tempfile
+import unittest
+
+from installer import LISP_BEGIN, LISP_END, patch_lisp_block
+
+
+LEGACY = ('(defun loadMyCUIX ()\n  (command "_.CUILOAD" "bhutuu.cuix")\n)\n'
+          '(defun S::STARTUP ()\n  (loadMyCUIX)\n)\n')
+BLOCK = f"{LISP_BEGIN}\n(new script)\n{LISP_END}\n"
+
+
+class PatchLispBlockTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "acad.lsp")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, text):
+        with open(self.path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+
+    def read(self):
+        with open(self.path, "r", encoding="utf-8", newline="") as f:
+            return f.read()
+
+    def test_creates_missing_file(self):
+        self.assertTrue(patch_lisp_block(self.path, "(new script)"))
+        self.assertEqual(self.read(), BLOCK)
+
+    def test_is_idempotent(self):
+        self.write('(princ "user stuff")')
+        self.assertTrue(patch_lisp_block(self.path, "(new script)"))
+        patched = self.read()
+        mtime = os.stat(self.path).st_mtime_ns
+        self.assertFalse(patch_lisp_block(self.path, "(new script)"))
+        self.assertEqual(self.read(), patched)
+        self.assertEqual(os.stat(self.path).st_mtime_ns, mtime)
+        self.assertEqual(patched, '(princ "user stuff")\n' + BLOCK)
+
+    def test_replaces_block_in_place_and_drops_duplicates(self):
+        old = f"{LISP_BEGIN}\n(old script)\n{LISP_END}\n"
+        self.write("(before)\n" + old + "(middle)\n" + old + "(after)\n")
+        self.assertTrue(patch_lisp_block(self.path, "(new script)"))
+        self.assertEqual(self.read(), "(before)\n" + BLOCK + "(middle)\n(after)\n")
+
+    def test_migrates_legacy_copy(self):
+        self.write('(princ "user stuff")\n' + LEGACY + "(after)\n")
+        self.assertTrue(patch_lisp_block(self.path, "(new script)"))
+        self.assertEqual(self.read(), '(princ "user stuff")\n' + BLOCK + "(after)\n")
+
+    def test_migrated_block_starts_its_own_line(self):
+        self.write('(princ "user stuff")' + LEGACY)
+        self.assertTrue(patch_lisp_block(self.path, "(new script)"))
+        self.assertEqual(self.read(), '(princ "user stuff")\n' + BLOCK)
+        self.assertFalse(patch_lisp_block(self.path, "(new script)"))
+
+    def test_keeps_crlf_user_lines(self):
+        self.write("(one)\r\n(two)\r\n")
+        patch_lisp_block(self.path, "(new script)")
+        self.assertTrue(self.read().startswith("(one)\r\n(two)\r\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+"""Checks for the office mirror: file:// transfers and falling back to GitHub.
+
+    python -m unittest discover -s setup
+"""
+import http.server
+import json
+import os
+import pathlib
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import installer
+import mirror
+from installer import MANIFEST_ASSET, MIRROR_INDEX, RESOURCE_DIR, _release_info, create_session
+from mock_release_server import MockReleaseServer, build_manifest, build_release, installer_for
+
+
+class LocalFileAdapterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data = os.urandom(5000)
+        path = os.path.join(self.tmp.name, "release file.zip")
+        with open(path, "wb") as f:
+            f.write(self.data)
+        self.url = pathlib.Path(path).as_uri()
+        self.session = create_session()
+
+    def tearDown(self):
+        self.session.close()
+        self.tmp.cleanup()
+
+    def test_whole_file(self):
+        r = self.session.get(self.url)
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.content, self.data)
+        self.assertEqual(r.headers["Content-Length"], "5000")
+        self.assertIn("Last-Modified", r.headers)
+
+    def test_streamed_range(self):
+        with self.session.get(self.url, stream=True, headers={"Range": "bytes=1000-"}) as r:
+            self.assertEqual(r.status_code, 206)
+            self.assertEqual(r.headers["Content-Range"], "bytes 1000-4999/5000")
+            self.assertEqual(b"".join(r.iter_content(777)), self.data[1000:])
+
+    def test_closed_range(self):
+        r = self.session.get(self.url, headers={"Range": "bytes=10-19"})
+        self.assertEqual(r.status_code, 206)
+        self.assertEqual(r.content, self.data[10:20])
+
+    def test_range_past_the_end(self):
+        r = self.session.get(self.url, headers={"Range": "bytes=5000-"})
+        self.assertEqual(r.status_code, 416)
+        self.assertEqual(r.headers["Content-Range"], "bytes */5000")
+
+    def test_missing_file(self):
+        r = self.session.get(self.url + ".missing")
+        self.assertEqual(r.status_code, 404)
+        with self.assertRaises(Exception):
+            r.raise_for_status()
+
+
+class MirrorHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        folder = self.tmp.name
+        with open(os.path.join(folder, MIRROR_INDEX), "w", encoding="utf-8") as f:
+            json.dump({"tag_name": "StreetViewLocate_V1.0", "assets": [{"name": "a.zip", "size": 10}]}, f)
+        for name in ("a.zip", "secret.txt"):
+            with open(os.path.join(folder, name), "wb") as f:
+                f.write(b"0123456789")
+        handler = type("Handler", (mirror.MirrorHandler,), {"folder": folder, "log_message": lambda *a: None})
+        self.httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.addCleanup(self.httpd.server_close)
+        self.addCleanup(self.httpd.shutdown)
+        self.url = f"http://127.0.0.1:{self.httpd.server_port}"
+        self.session = create_session()
+        self.addCleanup(self.session.close)
+
+    def get(self, name, **headers):
+        return self.session.get(f"{self.url}/{name}", headers=headers, timeout=5)
+
+    def test_serves_listed_files(self):
+        self.assertEqual(self.get(MIRROR_INDEX).status_code, 200)
+        self.assertEqual(self.get("a.zip").content, b"0123456789")
+        r = self.get("a.zip", Range="bytes=4-")
+        self.assertEqual((r.status_code, r.content), (206, b"456789"))
+
+    def test_refuses_everything_else(self):
+        for name in ("secret.txt", "missing.zip", "C:secret.txt", "C%3Asecret.txt",
+                     "..%2Fa.zip", "..%5Ca.zip", "%2Fetc%2Fpasswd", ""):
+            self.assertEqual(self.get(name).status_code, 404, name)
+
+
+class MirrorFallbackTest(unittest.TestCase):
+    """Seats fall back to GitHub for any file the mirror cannot serve intact."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        patcher = mock.patch.object(installer, "RETRY_BACKOFF", 0.001)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.share = os.path.join(self.tmp.name, "share")
+        self.root = os.path.join(self.tmp.name, "root")
+
+    def publish(self, version):
+        """Serve version from the mock GitHub and copy it into the share like a mirror would."""
+        assets = build_release(os.path.join(self.tmp.name, version), version, 256 * 1024)
+        self.github = MockReleaseServer(version, assets, cuix=b"cuix",
+                                        manifest=build_manifest(assets)).start()
+        self.addCleanup(self.github.stop)
+        _release_info.clear()
+        mirror.sync_mirror(self.share, installer_for(self.github, os.path.join(self.tmp.name, "m" + version)))
+        _release_info.clear()
+        return assets
+
+    def install(self):
+        engine = installer_for(self.github, self.root, mirror=self.share)
+        errors = []
+        engine.subscribe(type("Catcher", (installer.InstallObserver,), {"on_failed": lambda _, e: errors.append(e)})())
+        ok = engine.run()
+        self.assertTrue(ok, errors)
+        return engine
+
+    def test_missing_mirror_copy(self):
+        self.publish("1.0")
+        os.remove(os.path.join(self.share, RESOURCE_DIR + ".zip"))
+        engine = self.install()
+        self.assertEqual(len(engine.mirror_failed), 1)
+        self.assertTrue(os.path.isdir(os.path.join(engine.paths.local_appdata, RESOURCE_DIR)))
+        # the share gets the copy it was missing
+        self.assertTrue(os.path.isfile(os.path.join(self.share, RESOURCE_DIR + ".zip")))
+
+    def test_corrupt_mirror_copy(self):
+        assets = self.publish("1.0")
+        plugin = [name for name in assets if name != RESOURCE_DIR + ".zip"][0]
+        path = os.path.join(self.share, plugin)
+        with open(path, "r+b") as f:
+            f.seek(1000)
+            f.write(b"\0" * 64)
+        engine = self.install()
+        self.assertEqual(len(engine.mirror_failed), 1)
+        self.assertTrue(os.listdir(engine.paths.win64))
+
+    def test_delta_reads_fall_back(self):
+        self.publish("1.0")
+        self.install()
+        self.publish("1.1")
+        os.remove(os.path.join(self.share, MANIFEST_ASSET))
+        with open(os.path.join(self.share, RESOURCE_DIR + ".zip"), "r+b") as f:
+            f.truncate(1000)
+        engine = self.install()
+        phases = [record["phase"] for record in engine.metrics.summary()["phases"]]
+        self.assertIn("delta", phases)
+        self.assertNotIn("download", phases)
+        self.assertEqual(len(engine.mirror_failed), 2)
+        self.assertEqual(engine.version, "1.1")
+
+
+if __name__ == "__main__":
+    unittest.main()
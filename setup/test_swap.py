@@ -0,0 +1,68 @@
+"""Checks that a failed install leaves the previous install (or nothing) in place.
+
+    python -m unittest discover -s setup
+"""
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from unittest import mock
+
+import installer
+from installer import RESOURCE_DIR, Installer, _release_info
+from mock_release_server import MockReleaseServer, build_manifest, build_release, installer_for
+
+
+class SwapRollbackTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = os.path.join(self.tmp.name, "root")
+        patcher = mock.patch.object(installer, "RETRY_BACKOFF", 0.001)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def install(self, version):
+        assets = build_release(os.path.join(self.tmp.name, version), version, 256 * 1024)
+        server = MockReleaseServer(version, assets, cuix=b"cuix", manifest=build_manifest(assets)).start()
+        self.addCleanup(server.stop)
+        _release_info.clear()
+        engine = installer_for(server, self.root)
+        return engine, engine.run()
+
+    def installed_version(self, engine):
+        path = os.path.join(engine.paths.bundle, "PackageContents.xml")
+        return ET.parse(path).getroot().attrib.get("AppVersion") if os.path.exists(path) else None
+
+    def test_upgrade_keeps_previous_copy(self):
+        engine, ok = self.install("1.0")
+        self.assertTrue(ok)
+        self.assertFalse(os.path.exists(engine.paths.bundle + ".previous"))
+        engine, ok = self.install("1.1")
+        self.assertTrue(ok)
+        self.assertEqual(self.installed_version(engine), "1.1")
+        self.assertTrue(os.path.isdir(engine.paths.bundle + ".previous"))
+
+    def test_failed_upgrade_restores_previous_copy(self):
+        engine, _ = self.install("1.0")
+        resources = os.path.join(engine.paths.local_appdata, RESOURCE_DIR)
+        before = sorted(os.listdir(resources))
+        with mock.patch.object(Installer, "download_cuix", side_effect=Exception("cuix failed")):
+            engine, ok = self.install("1.1")
+        self.assertFalse(ok)
+        self.assertEqual(self.installed_version(engine), "1.0")
+        self.assertFalse(os.path.exists(engine.paths.bundle + ".previous"))
+        self.assertEqual(sorted(os.listdir(resources)), before)
+
+    def test_failed_fresh_install_leaves_nothing(self):
+        with mock.patch.object(Installer, "download_cuix", side_effect=Exception("cuix failed")):
+            engine, ok = self.install("1.0")
+        self.assertFalse(ok)
+        self.assertFalse(os.path.exists(engine.paths.bundle))
+        self.assertFalse(os.path.exists(os.path.join(engine.paths.local_appdata, RESOURCE_DIR)))
+        self.assertFalse(engine.is_already_installed())
+
+
+if __name__ == "__main__":
+    unittest.main()